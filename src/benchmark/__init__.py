@@ -1,9 +1,15 @@
 """Benchmark framework modules."""
 
-from benchmark.service_factory import ServiceFactory
-from benchmark.servers.base_server_manager import BaseServerManager
-from benchmark.workload.controller import BaseWorkloadController
-from benchmark.workload.executor import BaseWorkloadExecutor
+import importlib
+
+# Exported names are imported on first access: the orchestrator and the
+# client executors each need only part of the package
+_EXPORTS = {
+    "ServiceFactory": "benchmark.service_factory",
+    "BaseServerManager": "benchmark.servers.base_server_manager",
+    "BaseWorkloadController": "benchmark.workload.controller",
+    "BaseWorkloadExecutor": "benchmark.workload.executor",
+}
 
 __all__ = [
     "ServiceFactory",
@@ -11,3 +17,12 @@ __all__ = [
     "BaseWorkloadController",
     "BaseWorkloadExecutor"
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
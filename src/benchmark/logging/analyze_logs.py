@@ -4,122 +4,383 @@ Benchmark Log Analyzer
 Analyzes aggregated.jsonl logs from HPC benchmark runs
 """
 
-import json
+import mmap
+import os
 import sys
 import re
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict, Counter
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 import statistics
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy not installed: latency stats fall back to statistics
+    np = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson not installed: stdlib json also accepts bytes
+    from json import loads as json_loads
+
+
+_LATENCY_RE = re.compile(r'(\d+\.\d+)s')
+_BENCH_RE = re.compile(r'\[Thread (\d+)\] Benchmark complete: (\d+) requests, (\d+) errors')
+_ERROR_KEYWORDS = ('error', 'failed', 'exception', 'traceback', 'fatal')
+_ERROR_RE = re.compile('|'.join(map(re.escape, _ERROR_KEYWORDS)), re.IGNORECASE)
+
+# Files at least this large are scanned through mmap instead of read whole
+_MMAP_THRESHOLD = 1 << 30
+# Rough aggregated.jsonl entry size, used to presize the log list for mmap'd files
+_TYPICAL_LINE_BYTES = 160
+# Error entries retained for the report when streaming (all are still counted)
+_MAX_STORED_ERRORS = 1000
+# Streamed files at least this large are folded in parallel worker processes
+_PARALLEL_THRESHOLD = 64 << 20
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts(timestamp: str) -> datetime:
+    """Parse an ISO-8601 log timestamp (memoized, bursts share timestamps)"""
+    if sys.version_info >= (3, 11):
+        return datetime.fromisoformat(timestamp)
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def _latency_stats(latencies: List[float]) -> Dict[str, float]:
+    """Summary statistics and linearly interpolated percentiles for latencies"""
+    if np is not None:
+        arr = np.asarray(latencies, dtype=np.float64)
+        p50, p90, p95, p99 = np.percentile(arr, [50, 90, 95, 99])
+        return {
+            'mean': arr.mean(),
+            'min': arr.min(),
+            'max': arr.max(),
+            'stdev': arr.std(ddof=1) if len(arr) > 1 else None,
+            'p50': p50, 'p90': p90, 'p95': p95, 'p99': p99
+        }
+    
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+        p50, p90, p95, p99 = cuts[49], cuts[89], cuts[94], cuts[98]
+    else:
+        p50 = p90 = p95 = p99 = latencies[0]
+    return {
+        'mean': statistics.mean(latencies),
+        'min': min(latencies),
+        'max': max(latencies),
+        'stdev': statistics.stdev(latencies) if len(latencies) > 1 else None,
+        'p50': p50, 'p90': p90, 'p95': p95, 'p99': p99
+    }
+
+
+def _decode_lines(lines):
+    """Yield parsed JSONL entries, skipping blank and invalid lines"""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json_loads(line)
+        except ValueError as e:
+            print(f"Warning: Skipping invalid JSON line: {e}")
+
+
+def _fold_logs(logs, max_errors: Optional[int] = _MAX_STORED_ERRORS) -> Dict[str, Any]:
+    """
+    Fold log entries in a single pass into the summary the analysis methods use.
+    
+    Only compact per-entry timeline arrays and the extracted values are kept,
+    so entries can be streamed. max_errors caps the retained error entries
+    (None keeps them all); every error is still counted.
+    """
+    n_logs = 0
+    start_time = end_time = None
+    components = Counter()
+    component_ids = {}
+    nodes = Counter()
+    timeline_ts = array('d')
+    timeline_components = array('H')
+    latencies = []
+    results = {
+        'threads': [],
+        'total_requests': 0,
+        'total_errors': 0
+    }
+    errors = []
+    error_count = 0
+    
+    for log in logs:
+        message = log['message']
+        component = log['component']
+        timestamp = _parse_ts(log['timestamp'])
+        n_logs += 1
+        
+        if start_time is None or timestamp < start_time:
+            start_time = timestamp
+        if end_time is None or timestamp > end_time:
+            end_time = timestamp
+        
+        components[component] += 1
+        nodes[log['node']] += 1
+        
+        component_id = component_ids.get(component)
+        if component_id is None:
+            component_id = component_ids[component] = len(component_ids)
+        timeline_ts.append(timestamp.timestamp())
+        timeline_components.append(component_id)
+        
+        # Request latencies from server logs
+        if component == 'server' and 'POST' in message and '/api/generate' in message:
+            match = _LATENCY_RE.search(message)
+            if match:
+                latencies.append(float(match.group(1)))
+        
+        # Benchmark completion statistics
+        if 'Benchmark complete' in message:
+            match = _BENCH_RE.search(message)
+            if match:
+                thread_id = int(match.group(1))
+                requests = int(match.group(2))
+                thread_errors = int(match.group(3))
+                
+                results['threads'].append({
+                    'thread_id': thread_id,
+                    'requests': requests,
+                    'errors': thread_errors
+                })
+                results['total_requests'] += requests
+                results['total_errors'] += thread_errors
+        
+        # Error messages
+        if _ERROR_RE.search(message):
+            error_count += 1
+            if max_errors is None or len(errors) < max_errors:
+                errors.append(log)
+    
+    return {
+        'n_logs': n_logs,
+        'start_time': start_time,
+        'end_time': end_time,
+        'components': components,
+        'nodes': nodes,
+        'component_names': list(component_ids),
+        'timeline_ts': timeline_ts,
+        'timeline_components': timeline_components,
+        'latencies': latencies,
+        'benchmark_results': results,
+        'errors': errors,
+        'error_count': error_count
+    }
+
+
+def _iter_shard_lines(jsonl_file: str, start: int, end: int):
+    """Yield the raw lines that begin within the byte range [start, end)"""
+    with open(jsonl_file, 'rb') as f:
+        if start > 0:
+            # Skip the line in progress; the previous shard owns it
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            yield line
+
+
+def _fold_shard(jsonl_file: str, start: int, end: int) -> Dict[str, Any]:
+    """Worker entry point: fold one newline-aligned byte range of the file"""
+    return _fold_logs(_decode_lines(_iter_shard_lines(jsonl_file, start, end)))
+
+
+def _merge_summaries(parts: List[Dict[str, Any]], max_errors: Optional[int] = _MAX_STORED_ERRORS) -> Dict[str, Any]:
+    """Combine per-shard summaries (in file order) into one"""
+    merged = _fold_logs(())
+    component_ids = {}
+    
+    for part in parts:
+        if not part['n_logs']:
+            continue
+        merged['n_logs'] += part['n_logs']
+        if merged['start_time'] is None or part['start_time'] < merged['start_time']:
+            merged['start_time'] = part['start_time']
+        if merged['end_time'] is None or part['end_time'] > merged['end_time']:
+            merged['end_time'] = part['end_time']
+        merged['components'] += part['components']
+        merged['nodes'] += part['nodes']
+        
+        # Shards number components in their own first-seen order; remap to ours
+        mapping = [component_ids.setdefault(name, len(component_ids))
+                   for name in part['component_names']]
+        merged['timeline_ts'].extend(part['timeline_ts'])
+        if mapping == list(range(len(mapping))):
+            merged['timeline_components'].extend(part['timeline_components'])
+        else:
+            merged['timeline_components'].extend(mapping[c] for c in part['timeline_components'])
+        
+        merged['latencies'].extend(part['latencies'])
+        merged['benchmark_results']['threads'].extend(part['benchmark_results']['threads'])
+        merged['benchmark_results']['total_requests'] += part['benchmark_results']['total_requests']
+        merged['benchmark_results']['total_errors'] += part['benchmark_results']['total_errors']
+        merged['errors'].extend(part['errors'])
+        merged['error_count'] += part['error_count']
+    
+    if max_errors is not None:
+        del merged['errors'][max_errors:]
+    merged['component_names'] = list(component_ids)
+    return merged
 
 
 class BenchmarkLogAnalyzer:
-    def __init__(self, jsonl_file: str)-> None:
+    def __init__(self, jsonl_file: str, in_memory: bool = False,
+                 workers: Optional[int] = None)-> None:
         self.jsonl_file = Path(jsonl_file)
+        self.in_memory = in_memory
+        self.workers = workers
         self.logs = []
-        self.load_logs()
-        
-    def load_logs(self)-> None:
-        """Load all log entries from JSONL file"""
+        self._summary = None
+        if in_memory:
+            self.load_logs()
+        else:
+            self._check_file()
+            summary = self._build_summary()
+            print(f"Loaded {summary['n_logs']} log entries\n")
+    
+    def _check_file(self)-> None:
+        """Exit with an error if the JSONL file does not exist"""
         if not self.jsonl_file.exists():
             print(f"Error: File not found: {self.jsonl_file}")
             sys.exit(1)
+        
+    def load_logs(self)-> None:
+        """Load all log entries from JSONL file"""
+        self._check_file()
             
-        with open(self.jsonl_file) as f:
-            for line in f:
-                try:
-                    self.logs.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Skipping invalid JSON line: {e}")
+        with open(self.jsonl_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    self._parse_lines(iter(data.readline, b''), size // _TYPICAL_LINE_BYTES)
+            else:
+                data = f.read()
+                self._parse_lines(data.split(b'\n'), data.count(b'\n') + 1)
         
+        self._summary = None
         print(f"Loaded {len(self.logs)} log entries\n")
     
+    def _parse_lines(self, lines, n_estimate: int)-> None:
+        """Decode raw JSONL lines into self.logs"""
+        logs = [None] * n_estimate
+        count = 0
+        for entry in _decode_lines(lines):
+            if count < n_estimate:
+                logs[count] = entry
+            else:
+                logs.append(entry)
+            count += 1
+        
+        del logs[count:]
+        self.logs.extend(logs)
+    
+    def _iter_logs(self):
+        """Yield log entries lazily, straight from the JSONL file"""
+        with open(self.jsonl_file, 'rb') as f:
+            yield from _decode_lines(f)
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        """
+        Fold the logs into the summary the analysis methods use (cached).
+        
+        Loaded logs are folded directly. Otherwise the file is streamed; files
+        of at least _PARALLEL_THRESHOLD bytes are split into newline-aligned
+        byte ranges folded in worker processes and merged in file order.
+        """
+        if self._summary is not None:
+            return self._summary
+        
+        if self.in_memory:
+            self._summary = _fold_logs(self.logs, max_errors=None)
+            return self._summary
+        
+        size = self.jsonl_file.stat().st_size
+        workers = self.workers or os.cpu_count() or 1
+        if workers > 1 and size >= _PARALLEL_THRESHOLD:
+            bounds = [size * i // workers for i in range(workers + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_fold_shard, [str(self.jsonl_file)] * workers,
+                                      bounds[:-1], bounds[1:]))
+            self._summary = _merge_summaries(parts)
+        else:
+            self._summary = _fold_logs(self._iter_logs())
+        return self._summary
+    
     def get_time_range(self) -> tuple:
         """Get start and end timestamps"""
-        if not self.logs:
-            return None, None
-        
-        timestamps = [datetime.fromisoformat(log['timestamp'].replace('Z', '+00:00')) 
-                     for log in self.logs]
-        return min(timestamps), max(timestamps)
+        summary = self._build_summary()
+        return summary['start_time'], summary['end_time']
     
     def analyze_components(self) -> Dict[str, int]:
         """Count logs per component"""
-        return Counter(log['component'] for log in self.logs)
+        return Counter(self._build_summary()['components'])
     
     def analyze_nodes(self) -> Dict[str, int]:
         """Count logs per node"""
-        return Counter(log['node'] for log in self.logs)
+        return Counter(self._build_summary()['nodes'])
     
     def extract_latencies(self) -> List[float]:
         """Extract request latencies from server logs"""
-        latencies = []
-        pattern = r'(\d+\.\d+)s'
-        
-        for log in self.logs:
-            if log['component'] == 'server' and 'POST' in log['message'] and '/api/generate' in log['message']:
-                match = re.search(pattern, log['message'])
-                if match:
-                    latencies.append(float(match.group(1)))
-        
-        return latencies
+        return list(self._build_summary()['latencies'])
     
     def extract_benchmark_results(self) -> Dict[str, Any]:
         """Extract benchmark completion statistics"""
-        results = {
-            'threads': [],
-            'total_requests': 0,
-            'total_errors': 0
-        }
-        
-        pattern = r'\[Thread (\d+)\] Benchmark complete: (\d+) requests, (\d+) errors'
-        
-        for log in self.logs:
-            if 'Benchmark complete' in log['message']:
-                match = re.search(pattern, log['message'])
-                if match:
-                    thread_id = int(match.group(1))
-                    requests = int(match.group(2))
-                    errors = int(match.group(3))
-                    
-                    results['threads'].append({
-                        'thread_id': thread_id,
-                        'requests': requests,
-                        'errors': errors
-                    })
-                    results['total_requests'] += requests
-                    results['total_errors'] += errors
-        
-        return results
+        results = self._build_summary()['benchmark_results']
+        return {**results, 'threads': list(results['threads'])}
     
     def find_errors(self) -> List[Dict[str, Any]]:
-        """Find all error messages"""
-        errors = []
-        error_keywords = ['error', 'failed', 'exception', 'traceback', 'fatal']
-        
-        for log in self.logs:
-            msg_lower = log['message'].lower()
-            if any(keyword in msg_lower for keyword in error_keywords):
-                errors.append(log)
-        
-        return errors
+        """Find error messages (capped at _MAX_STORED_ERRORS unless in memory)"""
+        return list(self._build_summary()['errors'])
+    
+    def count_errors(self) -> int:
+        """Count all error messages"""
+        return self._build_summary()['error_count']
     
     def analyze_timeline(self, interval_seconds: int = 10) -> Dict[str, List[int]]:
         """Group logs by time intervals"""
-        if not self.logs:
+        summary = self._build_summary()
+        if not summary['n_logs']:
             return {}
         
-        start_time, end_time = self.get_time_range()
-        duration = (end_time - start_time).total_seconds()
+        start_ts = summary['start_time'].timestamp()
+        names = summary['component_names']
+        
+        if np is not None:
+            ts = np.frombuffer(summary['timeline_ts'], dtype=np.float64)
+            component_ids = np.frombuffer(summary['timeline_components'], dtype=np.uint16)
+            buckets = ((ts - start_ts) / interval_seconds).astype(np.int64)
+            
+            # Flat (interval, component) index -> counts, one C-level pass
+            n_buckets = int(buckets.max()) + 1
+            counts = np.bincount(buckets * len(names) + component_ids,
+                                 minlength=n_buckets * len(names)).reshape(n_buckets, len(names))
+            
+            intervals = {}
+            for interval_num in np.flatnonzero(counts.any(axis=1)):
+                row = counts[interval_num]
+                data = {'server': 0, 'client': 0}
+                for component_id, name in enumerate(names):
+                    if row[component_id]:
+                        data[name] = int(row[component_id])
+                intervals[int(interval_num)] = data
+            return intervals
         
         intervals = defaultdict(lambda: {'server': 0, 'client': 0})
         
-        for log in self.logs:
-            timestamp = datetime.fromisoformat(log['timestamp'].replace('Z', '+00:00'))
-            elapsed = (timestamp - start_time).total_seconds()
-            interval_num = int(elapsed / interval_seconds)
-            intervals[interval_num][log['component']] += 1
+        for ts, component_id in zip(summary['timeline_ts'], summary['timeline_components']):
+            interval_num = int((ts - start_ts) / interval_seconds)
+            intervals[interval_num][names[component_id]] += 1
         
         return dict(intervals)
     
@@ -157,27 +418,22 @@ class BenchmarkLogAnalyzer:
         # Latency analysis
         latencies = self.extract_latencies()
         if latencies:
+            stats = _latency_stats(latencies)
             print(f" Request Latency Analysis:")
             print(f"   Total requests: {len(latencies)}")
-            print(f"   Average: {statistics.mean(latencies):.3f}s")
-            print(f"   Median:  {statistics.median(latencies):.3f}s")
-            print(f"   Min:     {min(latencies):.3f}s")
-            print(f"   Max:     {max(latencies):.3f}s")
-            if len(latencies) > 1:
-                print(f"   StdDev:  {statistics.stdev(latencies):.3f}s")
+            print(f"   Average: {stats['mean']:.3f}s")
+            print(f"   Median:  {stats['p50']:.3f}s")
+            print(f"   Min:     {stats['min']:.3f}s")
+            print(f"   Max:     {stats['max']:.3f}s")
+            if stats['stdev'] is not None:
+                print(f"   StdDev:  {stats['stdev']:.3f}s")
             
             # Percentiles
-            sorted_lat = sorted(latencies)
-            p50 = sorted_lat[len(sorted_lat) * 50 // 100]
-            p90 = sorted_lat[len(sorted_lat) * 90 // 100]
-            p95 = sorted_lat[len(sorted_lat) * 95 // 100]
-            p99 = sorted_lat[len(sorted_lat) * 99 // 100]
-            
             print(f"\n   Percentiles:")
-            print(f"   P50: {p50:.3f}s")
-            print(f"   P90: {p90:.3f}s")
-            print(f"   P95: {p95:.3f}s")
-            print(f"   P99: {p99:.3f}s")
+            print(f"   P50: {stats['p50']:.3f}s")
+            print(f"   P90: {stats['p90']:.3f}s")
+            print(f"   P95: {stats['p95']:.3f}s")
+            print(f"   P99: {stats['p99']:.3f}s")
             print()
         
         # Benchmark results
@@ -201,7 +457,7 @@ class BenchmarkLogAnalyzer:
         # Error analysis
         errors = self.find_errors()
         if errors:
-            print(f" Errors Found: {len(errors)}")
+            print(f" Errors Found: {self.count_errors()}")
             print(f"   First 5 errors:")
             for error in errors[:5]:
                 print(f"   [{error['timestamp']}] [{error['node']}] {error['message'][:100]}")
@@ -241,7 +497,7 @@ class BenchmarkLogAnalyzer:
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python analyze_logs.py <aggregated.jsonl> [--export-csv]")
+        print("Usage: python analyze_logs.py <aggregated.jsonl> [--export-csv] [--in-memory] [--workers N]")
         print("\nExample:")
         print("  python analyze_logs.py aggregated.jsonl")
         print("  python analyze_logs.py experiments/test-logging-final_20251221_234115/aggregated.jsonl --export-csv")
@@ -249,8 +505,12 @@ def main():
     
     jsonl_file = sys.argv[1]
     export_csv = "--export-csv" in sys.argv
+    in_memory = "--in-memory" in sys.argv
+    workers = None
+    if "--workers" in sys.argv:
+        workers = int(sys.argv[sys.argv.index("--workers") + 1])
     
-    analyzer = BenchmarkLogAnalyzer(jsonl_file)
+    analyzer = BenchmarkLogAnalyzer(jsonl_file, in_memory=in_memory, workers=workers)
     analyzer.generate_report()
     
     if export_csv:
@@ -6,14 +6,62 @@ and aggregates them into centralized output files.
 """
 
 import os
+import re
 import time
 import json
+import queue
 import threading
 from pathlib import Path
 from typing import List, Dict, Any
-from datetime import datetime
 from benchmark.logging.base_log_collector import BaseLogCollector, LogSource
 
+try:
+    from orjson import dumps as json_dumps
+except ImportError:  # orjson not installed: stdlib json, encoded to match
+    def json_dumps(obj: Dict[str, Any]) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # Not Linux or not installed: fall back to polling tailers
+    INotify = None
+
+# How long the inotify watcher blocks before re-checking stop_event (ms)
+INOTIFY_TIMEOUT_MS = 500
+
+# Bytes requested per os.read() call when draining a tailed file
+READ_CHUNK_SIZE = 1 << 16
+
+# Line breaks as text-mode universal newlines see them; tqdm/pip progress
+# output ends its lines with a bare \r
+_LINE_BREAK = re.compile(rb'\r\n|\r|\n')
+
+# Maximum number of queued log lines the writer thread emits per write
+WRITE_BATCH_SIZE = 256
+
+# Block buffer size for the aggregated output files (flushed every flush_interval)
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+# Per-thread cache of the current UTC second and its "YYYY-MM-DDTHH:MM:SS." prefix
+_timestamp_cache = threading.local()
+
+
+def _utc_timestamp() -> str:
+    """
+    Format the current UTC time as ISO-8601 with microseconds and a 'Z' suffix.
+    
+    Equivalent to datetime.utcnow().isoformat() + 'Z', but built from
+    time.time_ns() with everything up to the seconds recomputed only when the
+    second changes; lines within the same second just append microseconds.
+    """
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    
+    if getattr(_timestamp_cache, "sec", None) != sec:
+        _timestamp_cache.sec = sec
+        _timestamp_cache.prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(sec))
+    
+    return f"{_timestamp_cache.prefix}{ns // 1000:06d}Z"
+
 
 class TailerLogCollector(BaseLogCollector):
     """
@@ -43,8 +91,20 @@ class TailerLogCollector(BaseLogCollector):
         # Internal state
         self.sources = []
         self.tailer_threads = []
+        self.writer_thread = None
         self.stop_event = threading.Event()
         
+        # Tailers enqueue (timestamp, source meta, line); one writer thread drains it
+        self._queue = queue.SimpleQueue()
+        
+        # Lines written so far, maintained by the single writer thread
+        self._stdout_lines = 0
+        self._jsonl_lines = 0
+        
+        # Per-source caches keyed by id(source) (LogSource is unhashable)
+        self._log_files = {}
+        self._source_meta = {}
+        
         # File handles
         self.stdout_handle = None
         self.stderr_handle = None
@@ -58,11 +118,11 @@ class TailerLogCollector(BaseLogCollector):
             self.sources = sources
             self.output_dir.mkdir(parents=True, exist_ok=True)
             
-            self.stdout_handle = open(self.stdout_file, 'w', buffering=1)
-            self.stderr_handle = open(self.stderr_file, 'w', buffering=1)
+            self.stdout_handle = open(self.stdout_file, 'w', buffering=OUTPUT_BUFFER_SIZE)
+            self.stderr_handle = open(self.stderr_file, 'w', buffering=OUTPUT_BUFFER_SIZE)
             
             if self.create_jsonl:
-                self.jsonl_handle = open(self.jsonl_file, 'w', buffering=1)
+                self.jsonl_handle = open(self.jsonl_file, 'wb', buffering=OUTPUT_BUFFER_SIZE)
             
             print(f"Log collector deployed successfully")
             print(f"  - stdout: {self.stdout_file}")
@@ -84,18 +144,46 @@ class TailerLogCollector(BaseLogCollector):
             self.running = True
             self.stop_event.clear()
             
+            self.writer_thread = threading.Thread(
+                target=self._write_log_entries,
+                daemon=True
+            )
+            self.writer_thread.start()
+            
+            log_files = [(source, self._get_log_file_for_source(source))
+                         for source in self.sources]
+            
+            # (node, component, stdout prefix) so the hot path skips attribute lookups
             for source in self.sources:
-                log_file = self._get_log_file_for_source(source)
-                
+                self._source_meta[id(source)] = (
+                    source.node,
+                    source.component,
+                    f"] [{source.node}] [{source.component}] "
+                )
+            
+            if INotify is not None:
+                # One event-driven thread tails every source
                 thread = threading.Thread(
-                    target=self._tail_log_file,
-                    args=(source, log_file),
+                    target=self._watch_log_files,
+                    args=(log_files,),
                     daemon=True
                 )
                 thread.start()
                 self.tailer_threads.append(thread)
                 
-                print(f"Started tailer for {source.component} on {source.node}")
+                for source, _ in log_files:
+                    print(f"Started tailer for {source.component} on {source.node}")
+            else:
+                for source, log_file in log_files:
+                    thread = threading.Thread(
+                        target=self._tail_log_file,
+                        args=(source, log_file),
+                        daemon=True
+                    )
+                    thread.start()
+                    self.tailer_threads.append(thread)
+                    
+                    print(f"Started tailer for {source.component} on {source.node}")
             
             # Create loggers_ready flag
             ready_file = self.output_dir / "loggers_ready"
@@ -110,13 +198,20 @@ class TailerLogCollector(BaseLogCollector):
             return False
     
     def _get_log_file_for_source(self, source: LogSource) -> Path:
-        """Determine the log file path for a given source."""
+        """Determine the log file path for a given source (memoized per source)."""
+        log_file = self._log_files.get(id(source))
+        if log_file is not None:
+            return log_file
+        
         if source.component == "server":
-            return self.output_dir / f"container_{source.node}.log"
+            log_file = self.output_dir / f"container_{source.node}.log"
         elif source.component == "client":
-            return self.output_dir / f"client_{source.node}.log"
+            log_file = self.output_dir / f"client_{source.node}.log"
         else:
             raise ValueError(f"Unknown component type: {source.component}")
+        
+        self._log_files[id(source)] = log_file
+        return log_file
     
     def _tail_log_file(self, source: LogSource, log_file: Path):
         """Tail a log file and write to aggregated outputs."""
@@ -124,45 +219,199 @@ class TailerLogCollector(BaseLogCollector):
         
         # Wait for file to exist
         while not log_file.exists() and not self.stop_event.is_set():
-            time.sleep(1)
+            self.stop_event.wait(1)
         
         if self.stop_event.is_set():
             return
         
+        fd = os.open(str(log_file), os.O_RDONLY | os.O_NONBLOCK)
+        entry = [fd, source, bytearray()]
         try:
-            with open(log_file, 'r') as f:
-                while not self.stop_event.is_set():
-                    line = f.readline()
+            while not self.stop_event.is_set():
+                if not self._drain_log_file(entry):
+                    self.stop_event.wait(0.1)
+            self._drain_log_file(entry, final=True)
                     
-                    if line:
-                        self._process_log_line(source, line.rstrip('\n'))
-                    else:
-                        time.sleep(0.1)
-                        
         except Exception as e:
             print(f"Error tailing {log_file}: {e}")
+        finally:
+            os.close(fd)
     
-    def _process_log_line(self, source: LogSource, line: str):
-        """Process a single log line from a source."""
+    def _watch_log_files(self, log_files: List[tuple]):
+        """
+        Tail all log files from a single thread woken by inotify events.
+        
+        Every file is drained each time inotify.read() returns, including on
+        timeout: writes made from other hosts to a shared filesystem (srun
+        output on Lustre/NFS) raise no inotify events, so the events only make
+        local writes show up sooner.
+        """
+        inotify = INotify()
+        watch_flags = inotify_flags.MODIFY | inotify_flags.CREATE
+        watched_dirs = {}  # watch descriptor -> directory
+        pending = list(log_files)
+        open_errors = set()  # files whose open failure was already reported
+        tailed = {}  # log file -> [fd, source, partial line buffer]
+        
         try:
-            timestamp = datetime.utcnow().isoformat() + 'Z'
-            
-            # Write to aggregated stdout with metadata
-            log_entry = f"[{timestamp}] [{source.node}] [{source.component}] {line}\n"
-            self.stdout_handle.write(log_entry)
-            
-            # Write to structured .jsonl
-            if self.create_jsonl and self.jsonl_handle:
-                jsonl_entry = {
-                    "timestamp": timestamp,
-                    "node": source.node,
-                    "component": source.component,
-                    "message": line
-                }
-                self.jsonl_handle.write(json.dumps(jsonl_entry) + '\n')
+            while not self.stop_event.is_set():
+                # Open files that have appeared since the last pass; a file
+                # that cannot be opened yet is retried on the next one
+                still_pending = []
+                for source, log_file in pending:
+                    try:
+                        parent = log_file.parent
+                        if parent.is_dir() and parent not in watched_dirs.values():
+                            watched_dirs[inotify.add_watch(parent, watch_flags)] = parent
+                        if not log_file.exists():
+                            still_pending.append((source, log_file))
+                            continue
+                        fd = os.open(str(log_file), os.O_RDONLY | os.O_NONBLOCK)
+                    except OSError as e:
+                        if log_file not in open_errors:
+                            open_errors.add(log_file)
+                            print(f"Error opening {log_file}, will retry: {e}")
+                        still_pending.append((source, log_file))
+                        continue
+                    print(f"Starting tail for {log_file}")
+                    tailed[log_file] = [fd, source, bytearray()]
+                pending = still_pending
                 
+                inotify.read(timeout=INOTIFY_TIMEOUT_MS)
+                self._drain_tailed_files(tailed)
+                        
         except Exception as e:
-            print(f"Error processing log line: {e}")
+            print(f"Error watching log files: {e}")
+        finally:
+            # Pick up whatever was written since the last pass
+            self._drain_tailed_files(tailed, final=True)
+            for fd, _, _ in tailed.values():
+                os.close(fd)
+            inotify.close()
+    
+    def _drain_tailed_files(self, tailed: Dict[Path, list], final: bool = False):
+        """
+        Drain every tailed file; a file that fails to read is reported and
+        dropped without affecting the others.
+        """
+        for log_file, entry in list(tailed.items()):
+            try:
+                self._drain_log_file(entry, final=final)
+            except Exception as e:
+                print(f"Error tailing {log_file}, no longer tailing it: {e}")
+                del tailed[log_file]
+                try:
+                    os.close(entry[0])
+                except OSError:
+                    pass
+    
+    def _drain_log_file(self, entry: list, final: bool = False) -> bool:
+        """
+        Read everything newly appended to a tailed file and process complete lines.
+        
+        Lines end at \r\n, \r or \n, as with text-mode reads.
+        
+        Args:
+            entry: [fd, source, partial line buffer] of the tailed file
+            final: Also emit the unterminated last line (the file is done)
+        
+        Returns:
+            True if any data was read, False if the file had nothing new
+        """
+        fd, source, buf = entry
+        read_any = False
+        
+        while True:
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            read_any = True
+            buf.extend(chunk)
+            
+            # A trailing \r may be the first half of a \r\n split across reads
+            cut = len(buf) - 1 if buf.endswith(b'\r') else len(buf)
+            *lines, rest = _LINE_BREAK.split(buf[:cut])
+            for line in lines:
+                self._process_log_line(source, line.decode('utf-8', errors='replace'))
+            buf = bytearray(rest) + buf[cut:]
+        
+        if final and buf:
+            line = buf[:-1] if buf.endswith(b'\r') else buf
+            self._process_log_line(source, line.decode('utf-8', errors='replace'))
+            buf = bytearray()
+        
+        entry[2] = buf
+        return read_any
+    
+    def _process_log_line(self, source: LogSource, line: str):
+        """Timestamp a single log line from a source and hand it to the writer."""
+        timestamp = _utc_timestamp()
+        self._queue.put((timestamp, self._source_meta[id(source)], line))
+    
+    def _write_log_entries(self):
+        """
+        Drain queued log lines and write them to the aggregated outputs in batches.
+        
+        Outputs are block-buffered; this thread also flushes them every
+        flush_interval seconds so readers never lag further behind than that.
+        """
+        stopping = False
+        next_flush = time.monotonic() + self.flush_interval
+        
+        while not stopping:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                batch = []
+            
+            while batch and len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # A None sentinel from stop_collection ends the writer
+            if None in batch:
+                batch = batch[:batch.index(None)]
+                stopping = True
+            
+            if batch:
+                try:
+                    # Write to aggregated stdout with metadata
+                    self.stdout_handle.write(''.join(
+                        f"[{timestamp}{prefix}{line}\n"
+                        for timestamp, (_, _, prefix), line in batch
+                    ))
+                    self._stdout_lines += len(batch)
+                
+                    # Write to structured .jsonl
+                    if self.create_jsonl and self.jsonl_handle:
+                        self.jsonl_handle.write(b''.join(
+                            json_dumps({
+                                "timestamp": timestamp,
+                                "node": node,
+                                "component": component,
+                                "message": line
+                            }) + b'\n'
+                            for timestamp, (node, component, _), line in batch
+                        ))
+                        self._jsonl_lines += len(batch)
+                    
+                except Exception as e:
+                    print(f"Error writing log lines: {e}")
+            
+            if stopping or time.monotonic() >= next_flush:
+                self._flush_outputs()
+                next_flush = time.monotonic() + self.flush_interval
+    
+    def _flush_outputs(self):
+        """Flush all open aggregated output files."""
+        for handle in (self.stdout_handle, self.stderr_handle, self.jsonl_handle):
+            try:
+                if handle:
+                    handle.flush()
+            except Exception as e:
+                print(f"Error flushing log output: {e}")
     
     def is_ready(self) -> bool:
         """Check if log collector is ready."""
@@ -177,8 +426,15 @@ class TailerLogCollector(BaseLogCollector):
             self.stop_event.set()
             self.running = False
             
+            # Tailers all see stop_event at once; bound the total wait rather
+            # than giving each thread its own timeout
+            deadline = time.monotonic() + 5
             for thread in self.tailer_threads:
-                thread.join(timeout=5)
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            
+            if self.writer_thread:
+                self._queue.put(None)
+                self.writer_thread.join(timeout=5)
             
             if self.stdout_handle:
                 self.stdout_handle.close()
@@ -187,8 +443,12 @@ class TailerLogCollector(BaseLogCollector):
             if self.jsonl_handle:
                 self.jsonl_handle.close()
             
+            # The writer's counters are exact once it has drained the queue;
+            # otherwise fall back to re-reading the files
+            counters_valid = self.writer_thread is not None and not self.writer_thread.is_alive()
+            
             summary = {
-                "stdout_lines": self._count_lines(self.stdout_file),
+                "stdout_lines": self._stdout_lines if counters_valid else self._count_lines(self.stdout_file),
                 "stderr_lines": self._count_lines(self.stderr_file),
                 "files_created": [
                     str(self.stdout_file),
@@ -197,7 +457,7 @@ class TailerLogCollector(BaseLogCollector):
             }
             
             if self.create_jsonl:
-                summary["jsonl_lines"] = self._count_lines(self.jsonl_file)
+                summary["jsonl_lines"] = self._jsonl_lines if counters_valid else self._count_lines(self.jsonl_file)
                 summary["files_created"].append(str(self.jsonl_file))
             
             print(f"Log collection stopped. Summary: {summary}")
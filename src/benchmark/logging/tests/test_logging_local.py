@@ -72,14 +72,18 @@ def test_basic_logging():
         
         # Simulate container logs being written
         print("\n[3] Simulating log generation...")
-        for i in range(5):
-            server_log.write_text(
-                server_log.read_text() + f"[Server] Log message {i}\n"
-            )
-            client_log.write_text(
-                client_log.read_text() + f"[Client] Request {i} completed\n"
-            )
-            time.sleep(0.5)
+        sfh = server_log.open('a')
+        cfh = client_log.open('a')
+        try:
+            for i in range(5):
+                sfh.write(f"[Server] Log message {i}\n")
+                sfh.flush()
+                cfh.write(f"[Client] Request {i} completed\n")
+                cfh.flush()
+                time.sleep(0.5)
+        finally:
+            sfh.close()
+            cfh.close()
         
         print("✓ Generated 10 log lines")
         
@@ -90,6 +94,8 @@ def test_basic_logging():
         print("\n[4] Stopping log collection...")
         summary = collector.stop_collection()
         print(f"✓ Stopped. Summary: {summary}")
+        assert summary["stdout_lines"] == 10, "stdout line count mismatch"
+        assert summary["jsonl_lines"] == 10, "jsonl line count mismatch"
         
         # Verify outputs
         print("\n[5] Verifying outputs...")
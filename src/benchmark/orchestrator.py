@@ -6,18 +6,37 @@ while using the new class-based architecture internally.
 """
 
 import argparse
-from pathlib import Path
+import atexit
+import base64
+from concurrent.futures import ThreadPoolExecutor
 from benchmark.service_factory import ServiceFactory
 import time
 import json
-import yaml
+import logging
+import logging.handlers
 import os
+import queue
 import sys
-import socket
 import benchmark.service_registry
 from benchmark.logging.base_log_collector import LogSource
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
+
+# Per-poll progress goes through logging at DEBUG; milestones are printed
+logger = logging.getLogger("benchmark.orchestrator")
+
 def main():
+    try:
+        _run()
+    finally:
+        # Drop the pooled keep-alive connections to servers and clients
+        ServiceFactory.close_session()
+
+
+def _run():
     parser = argparse.ArgumentParser(description="Benchmark Orchestrator")
     parser.add_argument("--server-nodes", type=str, nargs='+', required=True,
                        help="List of server node hostnames")
@@ -29,8 +48,11 @@ def main():
                        help="Port for client servers (default: 5000)")
     parser.add_argument("--timeout", type=int, default=600,
                        help="Timeout in seconds")
-    parser.add_argument("--workload-config-file", type=str, required=True,
+    config_group = parser.add_mutually_exclusive_group(required=True)
+    config_group.add_argument("--workload-config-file", type=str,
                        help="Path to the workload configuration file ")
+    config_group.add_argument("--workload-config-inline", type=str,
+                       help="Base64-encoded JSON workload configuration (no file is read or removed)")
     parser.add_argument("--enable-monitoring", action="store_true",
                        help="Enable system monitoring during benchmark")
     parser.add_argument("--monitor-interval", type=int, default=5,
@@ -39,18 +61,39 @@ def main():
                        help="Output file for monitoring metrics (default: benchmark_metrics.csv)")
     parser.add_argument("--pushgateway-node", type=str,
                        help="Pushgateway node hostname (e.g., mel2145). Required if --enable-monitoring is used.")
+    parser.add_argument("--verbose", action="store_true",
+                       help="Print full per-client metrics and per-poll progress")
     args = parser.parse_args()
+
+    # Probe threads only enqueue their log records; one listener thread does
+    # the actual writes, so pollers never contend on the stdout lock
+    log_queue = queue.SimpleQueue()
+    log_handler = logging.StreamHandler(sys.stdout)
+    log_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
     
     OUTPUT_DIR = os.environ.get("OUTPUT_DIR", "./benchmark_output")
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     print(f"Output directory: {OUTPUT_DIR}")
 
-    # Load config file (supports both JSON and YAML)
-    with open(args.workload_config_file) as f:
-        if args.workload_config_file.endswith(('.yaml', '.yml')):
-            workload_config_input = yaml.safe_load(f)
-        else:
-            workload_config_input = json.load(f)
+    # Load config inline or from file (supports both JSON and YAML)
+    if args.workload_config_inline:
+        config_bytes = base64.b64decode(args.workload_config_inline)
+        workload_config_input = orjson.loads(config_bytes) if orjson is not None else json.loads(config_bytes)
+    else:
+        with open(args.workload_config_file, "rb") as f:
+            if args.workload_config_file.endswith(('.yaml', '.yml')):
+                # Only YAML configs pay for importing the parser
+                import yaml
+                workload_config_input = yaml.safe_load(f)
+            elif orjson is not None:
+                workload_config_input = orjson.loads(f.read())
+            else:
+                workload_config_input = json.load(f)
 
     server_nodes = args.server_nodes
     server_port = args.server_port
@@ -75,16 +118,26 @@ def main():
     # Build service endpoints
     service_endpoints = [f"http://{node}:{server_port}" for node in server_nodes]
 
-    # Verify server health
-    print(f"\nChecking {service} health on endpoints: {service_endpoints}")
-    if not server_manager.verify_health(service_endpoints, args.timeout):
-        print("Some server endpoints failed health check.")
-        exit(1)
+    # Create workload controller using the new architecture
+    workload_controller = ServiceFactory.create_workload_controller(
+        service,
+        client_nodes,
+        port=client_port,
+        timeout=args.timeout
+    )
 
-    # Prepare service (e.g., pull model)
-    print(f"\nPreparing {service} service...")
-    if not server_manager.prepare_service(service_endpoints, args.timeout):
-        print("Service preparation failed.")
+    # Client executors start independently of the servers, so wait for them
+    # while the servers are probed and prepared instead of afterwards
+    print("\nVerifying client health in the background...")
+    startup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="client-health")
+    client_health = startup_pool.submit(workload_controller.verify_client_health)
+    startup_pool.shutdown(wait=False)
+
+    # Verify server health and prepare the service (e.g., pull model)
+    print(f"\nChecking and preparing {service} on endpoints: {service_endpoints}")
+    if not server_manager.ensure_ready(service_endpoints, args.timeout):
+        print("Some server endpoints failed health check or preparation.")
+        workload_controller.cancel_event.set()
         exit(1)
 
     print(f"All {service} endpoints healthy and prepared successfully.")
@@ -95,10 +148,12 @@ def main():
         if not args.pushgateway_node:
             print("Error: --pushgateway-node is required when --enable-monitoring is used.")
             print("Find your Pushgateway node with: squeue -u $USER -n pushgateway -h -o %N")
+            workload_controller.cancel_event.set()
             exit(1)
             
         try:
             sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+            import socket
             from monitor.monitor import Monitor
             
             pushgateway_node = args.pushgateway_node
@@ -145,17 +200,9 @@ def main():
             print("Continuing without monitoring...")
             monitor = None
 
-    # Create workload controller using the new architecture
-    workload_controller = ServiceFactory.create_workload_controller(
-        service,
-        client_nodes,
-        port=client_port,
-        timeout=args.timeout
-    )
-
     # Verify client health
-    print("\nVerifying client health...")
-    if not workload_controller.verify_client_health():
+    print("\nWaiting for client health check...")
+    if not client_health.result():
         print("Some clients failed health check.")
         exit(1)
 
@@ -217,21 +264,18 @@ def main():
     # ----------------------------
     # Benchmark suite execution
     # ----------------------------
-    import copy
-
     def _merge_workload_overrides(workload_config_input: dict, overrides: dict) -> dict:
         """
         Merge per-benchmark overrides into either:
           - workload_config_input["workload"] (preferred nested format), or
           - workload_config_input (flat format)
-        Returns a new dict (does not mutate input).
+        Returns a new dict (does not mutate input). Only the dicts that receive
+        overrides are copied; untouched values are shared with the input.
         """
-        cfg = copy.deepcopy(workload_config_input)
-        if isinstance(cfg.get("workload"), dict):
-            cfg["workload"].update(overrides)
-        else:
-            cfg.update(overrides)
-        return cfg
+        workload = workload_config_input.get("workload")
+        if isinstance(workload, dict):
+            return {**workload_config_input, "workload": {**workload, **overrides}}
+        return {**workload_config_input, **overrides}
 
     def _get_suite(workload_config_input: dict) -> list:
         # Support both formats:
@@ -243,22 +287,63 @@ def main():
             return workload_config_input["benchmark_suite"]
         return []
 
-    def _poll_until_done(poll_interval_s: int = 10):
-        print("Polling client metrics to check for completion...")
+    def _append_snapshots(path: str) -> int:
+        # Only snapshots taken since the previous call are transferred; each
+        # one becomes a line of NDJSON tagged with its client node
+        new = workload_controller.fetch_snapshots()
+        lines = [
+            orjson.dumps({"node": node, **snap}) if orjson is not None
+            else json.dumps({"node": node, **snap}).encode()
+            for node, snaps in new.items() for snap in snaps
+        ]
+        if lines:
+            with open(path, "ab") as f:
+                f.write(b"\n".join(lines) + b"\n")
+        return len(lines)
+
+    def _poll_until_done(snapshots_path: str, poll_interval_s: float = 10,
+                         initial_interval_s: float = 0.25, wait_timeout_s: float = 30):
+        # Clients are long-polled on /wait, which returns as soon as their
+        # workload finishes; completion is then confirmed through /metrics.
+        # Nodes that cannot long-poll are polled with exponential backoff from
+        # initial_interval_s up to poll_interval_s. New real-time snapshots
+        # are appended to snapshots_path after every round.
+        print("Waiting for clients to complete the workload...")
+        pending = set(client_nodes)
+        interval = initial_interval_s
         while True:
-            all_metrics = workload_controller.fetch_metrics()
-            running_status = [m.get("running", True) for m in all_metrics.values()]
-            print(f"Client running status: {running_status}")
-            if all(not r for r in running_status):
+            targets = [node for node in client_nodes if node in pending]
+            signalled = workload_controller.wait_until_done(nodes=targets, timeout_per_call=wait_timeout_s)
+            logger.debug("Saved %d new snapshots", _append_snapshots(snapshots_path))
+            to_check = [node for node in targets if signalled.get(node) is not False]
+            if to_check:
+                all_metrics = workload_controller.fetch_metrics(nodes=to_check, deadline=poll_interval_s)
+                for node, m in all_metrics.items():
+                    if not m.get("running", True):
+                        pending.discard(node)
+            logger.debug("Clients still running: %s", sorted(pending))
+            if not pending:
                 print("All clients have completed the workload.")
                 return
-            print(f"Waiting {poll_interval_s} seconds before next poll...")
-            time.sleep(poll_interval_s)
-
-    def _write_json(path: str, obj: dict):
+            if any(signalled.get(node) is not False for node in pending):
+                logger.debug("Waiting %.2f seconds before next poll...", interval)
+                time.sleep(interval)
+                interval = min(poll_interval_s, interval * 2)
+
+    def _write_json(path: str, obj: dict, indent: bool = False):
+        # Write to a temporary file and rename it into place, so a crash never
+        # leaves a truncated result file behind
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(obj, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        else:
+            data = json.dumps(obj, indent=2 if indent else None).encode()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
 
     # Always include server endpoints in the workload config sent to clients
     base_workload_payload = {
@@ -292,24 +377,26 @@ def main():
             # no overrides; uses whatever is already in workload_config_input
         }]
 
-    for i, bench in enumerate(suite, start=1):
+    def _prepare_benchmark(i: int, bench: dict) -> tuple:
         bench_name = bench.get("name", f"bench_{i}")
-        print("\n" + "=" * 60)
-        print(f"Running benchmark {i}/{len(suite)}: {bench_name}")
-        print("=" * 60)
 
-        # Build per-benchmark config by applying overrides
-        per_bench_input = _merge_workload_overrides(workload_config_input, {k: v for k, v in bench.items() if k != "name"})
-        workload_payload = {
-            "server_endpoints": service_endpoints,
-            **per_bench_input
-        }
+        # Build per-benchmark payload by applying overrides to the shared base
+        overrides = {k: v for k, v in bench.items() if k != "name"}
+        workload_payload = _merge_workload_overrides(base_workload_payload, overrides)
 
         # Add benchmark identity so executors can include it in their metrics if desired
         if isinstance(workload_payload.get("workload"), dict):
             workload_payload["workload"]["benchmark_name"] = bench_name
         else:
             workload_payload["benchmark_name"] = bench_name
+        return bench_name, overrides, workload_payload
+
+    prepared = _prepare_benchmark(1, suite[0])
+    for i in range(1, len(suite) + 1):
+        bench_name, overrides, workload_payload = prepared
+        print("\n" + "=" * 60)
+        print(f"Running benchmark {i}/{len(suite)}: {bench_name}")
+        print("=" * 60)
 
         print("Starting workload execution...")
         if not workload_controller.start_workload(workload_payload):
@@ -317,29 +404,44 @@ def main():
             exit(1)
 
         print("All clients launched successfully.")
-        _poll_until_done(poll_interval_s=10)
+
+        # Prepare the next benchmark while this one runs, so it can be
+        # started as soon as this one completes
+        if i < len(suite):
+            prepared = _prepare_benchmark(i + 1, suite[i])
+        snapshots_path = os.path.join(results_dir, f"{bench_name}.snapshots.jsonl")
+        _poll_until_done(snapshots_path, poll_interval_s=10)
 
         print("Fetching final metrics from all clients...")
         final_metrics = workload_controller.fetch_metrics()
+        # Pick up the snapshots taken between the last poll and completion
+        _append_snapshots(snapshots_path)
+        print(f"Saved snapshots: {snapshots_path}")
 
         # Save per-benchmark raw metrics
         bench_out_path = os.path.join(results_dir, f"{bench_name}.metrics.json")
         _write_json(bench_out_path, {
             "benchmark_name": bench_name,
-            "overrides": {k: v for k, v in bench.items() if k != "name"},
+            "overrides": overrides,
             "client_metrics": final_metrics
         })
         print(f"Saved metrics: {bench_out_path}")
+        # The full dump can be large (per-client latency samples); it is on disk
+        if args.verbose:
+            print(f"Final metrics: {final_metrics}")
+        else:
+            print(f"Final metrics: {len(final_metrics)} clients, saved to {bench_out_path}")
 
         suite_results["benchmarks"].append({
             "benchmark_name": bench_name,
             "metrics_file": bench_out_path,
+            "snapshots_file": snapshots_path,
             "client_metrics": final_metrics
         })
 
     # Write suite summary
     suite_out_path = os.path.join(results_dir, "benchmark_suite.summary.json")
-    _write_json(suite_out_path, suite_results)
+    _write_json(suite_out_path, suite_results, indent=True)
     print("\nBenchmark suite complete.")
     print(f"Suite summary saved: {suite_out_path}")
 
@@ -350,11 +452,12 @@ def main():
         # Monitor will stop when the daemon thread exits with the main program
         print(f"Monitor output saved to: {args.monitor_output}")
 
-    try:
-        os.remove(args.workload_config_file)
-        print(f"Removed config file: {args.workload_config_file}")
-    except OSError as e:
-        print(f"Error removing config file: {e}")
+    if args.workload_config_file:
+        try:
+            os.remove(args.workload_config_file)
+            print(f"Removed config file: {args.workload_config_file}")
+        except OSError as e:
+            print(f"Error removing config file: {e}")
 
     
     
@@ -363,7 +466,8 @@ def main():
         print("Stopping log collection...")
         print("="*60)
         summary = log_collector.stop_collection()
-        print(f"Log collection summary: {summary}")
+        if args.verbose:
+            print(f"Log collection summary: {summary}")
         print(f"Logs saved to: {OUTPUT_DIR}")
         
     exit(0)
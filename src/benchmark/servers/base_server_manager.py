@@ -7,6 +7,7 @@ server managers must implement (e.g., OllamaServerManager, PostgresServerManager
 
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
+from benchmark.utility import requests
 
 
 class BaseServerManager(ABC):
@@ -27,6 +28,9 @@ class BaseServerManager(ABC):
             config: Service-specific configuration from the recipe
         """
         self.config = config
+        # HTTP session for server probes; ServiceFactory replaces it with the
+        # session shared by all managers and controllers
+        self.session = requests.Session()
 
     @abstractmethod
     def verify_health(self, endpoints: List[str], timeout: int = 600) -> bool:
@@ -62,6 +66,23 @@ class BaseServerManager(ABC):
         """
         pass
 
+    def ensure_ready(self, endpoints: List[str], timeout: int = 600) -> bool:
+        """
+        Wait until all endpoints are healthy and prepare the service on them.
+
+        The default runs verify_health and then prepare_service; managers can
+        override it to overlap the two phases per endpoint.
+
+        Args:
+            endpoints: List of server endpoint URLs
+            timeout: Maximum time in seconds for each phase
+
+        Returns:
+            True if every endpoint is healthy and prepared, False otherwise
+        """
+        return (self.verify_health(endpoints, timeout)
+                and self.prepare_service(endpoints, timeout))
+
     @abstractmethod
     def get_health_check_endpoint(self) -> str:
         """
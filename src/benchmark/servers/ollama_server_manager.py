@@ -7,10 +7,16 @@ Handles Ollama server lifecycle:
 """
 
 from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import logging
+import random
 import time
 import threading
 from benchmark.servers.base_server_manager import BaseServerManager
-from benchmark.utility import requests
+
+# Per-probe lines go through logging at DEBUG; state changes are printed
+logger = logging.getLogger(__name__)
 
 
 class OllamaServerManager(BaseServerManager):
@@ -20,6 +26,11 @@ class OllamaServerManager(BaseServerManager):
     Manages Ollama server health checks and model preparation.
     """
 
+    # Per-probe HTTP timeout while polling for readiness. A server that is
+    # still booting answers nothing at all, and a long probe would delay
+    # noticing it once it comes up; the poll loop simply retries.
+    probe_timeout = 1.0
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Ollama server manager.
@@ -31,6 +42,8 @@ class OllamaServerManager(BaseServerManager):
         self.model = config.get("model")
         if not self.model:
             raise ValueError("Ollama configuration must include 'model' parameter")
+        # Model names reported by each endpoint's last healthy /api/tags reply
+        self._endpoint_models: Dict[str, set] = {}
 
     def verify_health(self, endpoints: List[str], timeout: int = 600) -> bool:
         """
@@ -43,52 +56,96 @@ class OllamaServerManager(BaseServerManager):
         Returns:
             True if all endpoints are healthy, False otherwise
         """
+        # Several workers may share a node; probe each distinct URL once
+        endpoints = list(dict.fromkeys(endpoints))
         print(f'Checking health of {len(endpoints)} Ollama endpoints with timeout {timeout}s each...')
+        if not endpoints:
+            return True
+
+        # Endpoints are polled concurrently; the first one that times out
+        # aborts the others instead of letting them run to their own timeout
+        abort = threading.Event()
+        with ThreadPoolExecutor(max_workers=min(32, len(endpoints))) as pool:
+            futures = [pool.submit(self._poll_until_healthy, endpoint, timeout, abort)
+                       for endpoint in endpoints]
+            for future in as_completed(futures):
+                if not future.result():
+                    abort.set()
+                    for f in futures:
+                        f.cancel()
+                    return False
 
-        for endpoint in endpoints:
-            print(f'\nChecking endpoint: {endpoint}')
-            start = time.time()
-            healthy = False
+        print("All Ollama endpoints are healthy.")
+        return True
 
-            while time.time() - start < timeout:
-                healthy = self._check_single_endpoint_health(endpoint)
-                if healthy:
-                    break
-                time.sleep(2)
+    def _poll_until_healthy(self, endpoint: str, timeout: int,
+                            abort: threading.Event) -> bool:
+        """
+        Poll a single Ollama endpoint until it is healthy.
+
+        Args:
+            endpoint: Ollama server URL
+            timeout: Maximum time in seconds to wait for the endpoint
+            abort: Set when another endpoint failed and polling should stop
 
-            if not healthy:
-                print(f"Timeout reached: Ollama endpoint {endpoint} is not healthy.")
+        Returns:
+            True if the endpoint became healthy, False on timeout or abort
+        """
+        print(f'\nChecking endpoint: {endpoint}')
+        start = time.time()
+        # Capped exponential backoff with jitter: a server that is already up
+        # is seen almost immediately, a slow one is not probed every 2s
+        delay = 0.1
+        tags_url = f"{endpoint}/api/tags"
+
+        while time.time() - start < timeout:
+            if self._check_single_endpoint_health(endpoint, tags_url,
+                                                  timeout=self.probe_timeout):
+                return True
+            remaining = timeout - (time.time() - start)
+            if abort.wait(max(0.0, min(delay, remaining))):
                 return False
+            delay = min(delay * 1.5, 5.0) * (0.8 + 0.4 * random.random())
 
-        print("All Ollama endpoints are healthy.")
-        return True
+        print(f"Timeout reached: Ollama endpoint {endpoint} is not healthy.")
+        return False
 
-    def _check_single_endpoint_health(self, endpoint: str) -> bool:
+    def _check_single_endpoint_health(self, endpoint: str, tags_url: str = None,
+                                      timeout: float = 5) -> bool:
         """
         Check health of a single Ollama endpoint.
 
         Args:
             endpoint: Ollama server URL
+            tags_url: Precomputed /api/tags URL for callers that poll in a loop
+            timeout: HTTP timeout in seconds for this probe
 
         Returns:
             True if healthy, False otherwise
         """
         try:
-            print(f"Checking Ollama health at {endpoint}...", flush=True)
-            res = requests.get(f"{endpoint}/api/tags", timeout=5)
+            logger.debug("Checking Ollama health at %s...", endpoint)
+            res = self.session.get(tags_url or f"{endpoint}/api/tags", timeout=timeout)
             status = res.status_code
-            data = res.text
-            print(f"Health check response from {endpoint}: HTTP {status}, Data: {data}")
+            logger.debug("Health check response from %s: HTTP %d (%d bytes)",
+                         endpoint, status, len(res.content))
 
             if 200 <= status < 300:
                 print(f"Ollama healthy at {endpoint}")
+                # Only the final, successful probe parses the body
+                try:
+                    self._endpoint_models[endpoint] = {
+                        m.get("name") for m in res.json().get("models", [])
+                    }
+                except (ValueError, AttributeError):
+                    self._endpoint_models.pop(endpoint, None)
                 return True
             else:
-                print(f"Ollama unhealthy at {endpoint} (HTTP {status})")
+                logger.debug("Ollama unhealthy at %s (HTTP %s)", endpoint, status)
                 return False
 
         except Exception as e:
-            print(f"Ollama unreachable at {endpoint}: {e}")
+            logger.debug("Ollama unreachable at %s: %s", endpoint, e)
             return False
 
     def prepare_service(self, endpoints: List[str], timeout: int = 600) -> bool:
@@ -102,54 +159,164 @@ class OllamaServerManager(BaseServerManager):
         Returns:
             True if model pulled successfully on all endpoints, False otherwise
         """
-        threads = []
-        results = [False] * len(endpoints)
-
-        for idx, endpoint in enumerate(endpoints):
-            print(f"\nPulling model '{self.model}' from {endpoint}...")
-            t = threading.Thread(
-                target=self._pull_model_on_endpoint,
-                args=(endpoint, results, idx, timeout)
-            )
-            t.start()
-            threads.append(t)
-
-        # Wait for all pulls to complete
-        for t in threads:
-            t.join()
+        # Pull once per distinct URL; a duplicate would re-transfer the model
+        endpoints = list(dict.fromkeys(endpoints))
+        if not endpoints:
+            return True
+
+        # Set on the first failed pull so the overall result is known without
+        # waiting for slower endpoints that are still transferring the model
+        abort = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=min(32, len(endpoints)))
+        try:
+            futures = [pool.submit(self._pull_model_on_endpoint, endpoint, timeout, abort)
+                       for endpoint in endpoints]
+            for future in as_completed(futures):
+                if not future.result():
+                    abort.set()
+                    print("Model pull failed on an endpoint; not waiting for the remaining pulls")
+                    return False
+        finally:
+            # Running pulls see `abort` at their next progress line
+            pool.shutdown(wait=False, cancel_futures=True)
 
-        return all(results)
+        return True
 
-    def _pull_model_on_endpoint(self, endpoint: str, results: List[bool],
-                                idx: int, timeout: int):
+    def _pull_model_on_endpoint(self, endpoint: str, timeout: int,
+                                abort: threading.Event) -> bool:
         """
         Pull model on a single endpoint.
 
         Args:
             endpoint: Ollama server URL
-            results: Shared list to store success/failure
-            idx: Index in results list
             timeout: Request timeout
+            abort: Set when a pull failed elsewhere and this one should stop
+
+        Returns:
+            True if the model is available on the endpoint, False otherwise
         """
+        # /api/tags was read by the health check; a model that is already
+        # present does not need another /api/pull round-trip
+        if self._has_model(endpoint):
+            print(f"Model '{self.model}' already present at {endpoint}, skipping pull")
+            return True
+
+        print(f"\nPulling model '{self.model}' from {endpoint}...")
         try:
-            res = requests.post(
+            # Progress is streamed as NDJSON; read it line by line so a failure
+            # is seen as soon as Ollama reports it and the body is never buffered
+            deadline = time.time() + timeout
+            res = self.session.post(
                 f"{endpoint}/api/pull",
-                json={"model": self.model, "stream": False},
-                timeout=timeout
+                json={"model": self.model, "stream": True},
+                timeout=timeout,
+                stream=True
             )
             status = res.status_code
-            data = res.text
-
-            if 200 <= status < 300:
-                print(f"Pulled model '{self.model}' at {endpoint}: {data}")
-                results[idx] = True
-            else:
+            if not 200 <= status < 300:
+                res.close()
                 print(f"Failed to pull model '{self.model}' at {endpoint} (HTTP {status})")
-                results[idx] = False
+                return False
+
+            last_status = None
+            error = None
+            for line in res.iter_lines():
+                message = json.loads(line)
+                if "error" in message:
+                    error = message["error"]
+                    break
+                status = message.get("status", last_status)
+                if status != last_status:
+                    # Ollama repeats a status with byte counts; report phases only
+                    logger.debug("Pull of '%s' at %s: %s", self.model, endpoint, status)
+                    last_status = status
+                if last_status == "success":
+                    break
+                if time.time() > deadline:
+                    error = f"timed out after {timeout}s (last status: {last_status})"
+                    break
+                if abort.is_set():
+                    error = "aborted after a pull failed on another endpoint"
+                    break
+            res.close()
+
+            if last_status == "success":
+                print(f"Pulled model '{self.model}' at {endpoint}")
+                return True
+            print(f"Failed to pull model '{self.model}' at {endpoint}: "
+                  f"{error or f'stream ended with status {last_status}'}")
+            return False
 
         except Exception as e:
             print(f"Error pulling model '{self.model}' at {endpoint}: {e}")
-            results[idx] = False
+            return False
+
+    def ensure_ready(self, endpoints: List[str], timeout: int = 600) -> bool:
+        """
+        Wait for each endpoint to become healthy and pull the model on it.
+
+        Each endpoint is handled by its own task, so an endpoint that is up
+        early pulls the model while others are still being polled.
+
+        Args:
+            endpoints: List of Ollama server URLs
+            timeout: Maximum time in seconds for the health wait and for the pull
+
+        Returns:
+            True if all endpoints are healthy and have the model, False otherwise
+        """
+        endpoints = list(dict.fromkeys(endpoints))
+        print(f'Preparing {len(endpoints)} Ollama endpoints with timeout {timeout}s each...')
+        if not endpoints:
+            return True
+
+        abort = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=min(32, len(endpoints)))
+        try:
+            futures = [pool.submit(self._ensure_endpoint_ready, endpoint, timeout, abort)
+                       for endpoint in endpoints]
+            for future in as_completed(futures):
+                if not future.result():
+                    abort.set()
+                    print("An Ollama endpoint failed; not waiting for the remaining ones")
+                    return False
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        print("All Ollama endpoints are healthy and prepared.")
+        return True
+
+    def _ensure_endpoint_ready(self, endpoint: str, timeout: int,
+                               abort: threading.Event) -> bool:
+        """
+        Poll one endpoint until healthy, then make sure the model is present.
+
+        Args:
+            endpoint: Ollama server URL
+            timeout: Maximum time in seconds for each of the two steps
+            abort: Set when another endpoint failed and this one should stop
+
+        Returns:
+            True if the endpoint is healthy and has the model, False otherwise
+        """
+        return (self._poll_until_healthy(endpoint, timeout, abort)
+                and self._pull_model_on_endpoint(endpoint, timeout, abort))
+
+    def _has_model(self, endpoint: str) -> bool:
+        """
+        Check whether the last /api/tags reply from an endpoint listed the model.
+
+        Args:
+            endpoint: Ollama server URL
+
+        Returns:
+            True if the model is known to be present, False if absent or unknown
+        """
+        names = self._endpoint_models.get(endpoint)
+        if not names:
+            return False
+        # Ollama reports untagged models with the implicit ":latest" tag
+        return self.model in names or (":" not in self.model and f"{self.model}:latest" in names)
 
     def get_health_check_endpoint(self) -> str:
         """
@@ -189,3 +356,4 @@ class OllamaServerManager(BaseServerManager):
         }
 
         return config
+
@@ -5,11 +5,43 @@ This module handles Ray cluster initialization and management for multi-node
 vLLM deployments with tensor/pipeline parallelism.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import re
 import subprocess
 import time
 import socket
 
+# `ray status` lines such as " 1 node_4f2a..." (under "Active:") and
+# " 0.0/8.0 CPU" (under "Usage:")
+_NODE_RE = re.compile(r"^\s*(\d+) node_", re.MULTILINE)
+_CPU_RE = re.compile(r"(\d+(?:\.\d+)?)/(\d+(?:\.\d+)?) CPU")
+_GPU_RE = re.compile(r"(\d+(?:\.\d+)?)/(\d+(?:\.\d+)?) GPU")
+
+
+def _parse_ray_status(output: str) -> Dict[str, Any]:
+    """
+    Extract node and resource counts from `ray status` output.
+
+    Args:
+        output: stdout of `ray status`
+
+    Returns:
+        Dict with nodes, pending, cpus, cpus_used, gpus and gpus_used;
+        counts that do not appear in the output are 0
+    """
+    active, _, rest = output.partition("Pending:")
+    pending_block = rest.partition("Recent failures:")[0]
+    info = {
+        "nodes": sum(int(n) for n in _NODE_RE.findall(active)),
+        "pending": sum(1 for line in pending_block.splitlines()
+                       if line.strip() and not line.strip().startswith("(")),
+    }
+    for key, pattern in (("cpus", _CPU_RE), ("gpus", _GPU_RE)):
+        match = pattern.search(output)
+        info[f"{key}_used"] = float(match.group(1)) if match else 0.0
+        info[key] = float(match.group(2)) if match else 0.0
+    return info
+
 
 class RayClusterManager:
     """
@@ -33,6 +65,16 @@ class RayClusterManager:
                 - node_manager_port: Port for node manager (default: 8077)
                 - num_cpus_per_node: CPUs per node
                 - num_gpus_per_node: GPUs per node
+                - ray_ready_timeout: Seconds to wait for the head GCS port
+                  after `ray start` (default: 15)
+                - worker_join_timeout: Seconds to wait for started workers to
+                  appear in `ray status` (default: 60)
+                - container_image: Apptainer image remote workers run in
+                  (optional; `ray` is run directly when omitted)
+                - container_args: Extra `apptainer exec` flags such as
+                  ["--nv", "--bind", "/scratch/ray:/tmp/ray"] (default: [])
+                - log_dir: Directory for per-host `ray_worker_<host>.log`
+                  files (optional; output is discarded when omitted)
         """
         self.config = config
         self.dashboard_port = config.get("dashboard_port", 8265)
@@ -40,26 +82,71 @@ class RayClusterManager:
         self.node_manager_port = config.get("node_manager_port", 8077)
         self.num_cpus = config.get("num_cpus_per_node", 4)
         self.num_gpus = config.get("num_gpus_per_node", 1)
+        self.ready_timeout = config.get("ray_ready_timeout", 15)
+        self.join_timeout = config.get("worker_join_timeout", 60)
+        self.container_image: Optional[str] = config.get("container_image")
+        self.container_args: List[str] = list(config.get("container_args", []))
+        self.log_dir: Optional[str] = config.get("log_dir")
+        # Arguments shared by head and worker `ray start` commands
+        self._common_args: List[str] = [
+            f"--object-manager-port={self.object_manager_port}",
+            f"--node-manager-port={self.node_manager_port}",
+            f"--num-cpus={self.num_cpus}",
+            f"--num-gpus={self.num_gpus}",
+        ]
         self.head_address: Optional[str] = None
+        self._local_ip: Optional[str] = None
+        # `ray status` forks a CLI process; callers polling during start-up
+        # share one result per status_ttl seconds
+        self.status_ttl = 1.0
+        self._last_status: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Backgrounded `srun ... ray start --block` steps, one per remote host
+        self._worker_procs: Dict[str, subprocess.Popen] = {}
 
     def get_local_ip(self) -> str:
         """
         Get the local IP address for Ray cluster communication.
 
+        The address is resolved once and reused for the lifetime of the manager.
+
         Returns:
             Local IP address as string
         """
+        if self._local_ip is not None:
+            return self._local_ip
         try:
             # Create a socket to determine the local IP
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             s.connect(("8.8.8.8", 80))
             local_ip = s.getsockname()[0]
             s.close()
+            self._local_ip = local_ip
             return local_ip
         except Exception as e:
             print(f"Warning: Could not determine local IP, using localhost: {e}")
             return "127.0.0.1"
 
+    def _wait_for_gcs(self, address: str) -> bool:
+        """
+        Wait until the Ray GCS at `address` accepts TCP connections.
+
+        Args:
+            address: GCS address as "<host>:<port>"
+
+        Returns:
+            True once the port accepts a connection, False after ready_timeout
+        """
+        host, _, port = address.rpartition(":")
+        deadline = time.monotonic() + self.ready_timeout
+        while True:
+            try:
+                with socket.create_connection((host, int(port)), timeout=0.5):
+                    return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.1)
+
     def start_head_node(self, temp_dir: str = "/tmp/ray") -> str:
         """
         Start Ray head node.
@@ -74,6 +161,7 @@ class RayClusterManager:
             RuntimeError: If head node fails to start
         """
         print("Starting Ray head node...")
+        self._last_status = None
 
         local_ip = self.get_local_ip()
 
@@ -82,22 +170,17 @@ class RayClusterManager:
             "--head",
             f"--node-ip-address={local_ip}",
             f"--dashboard-port={self.dashboard_port}",
-            f"--object-manager-port={self.object_manager_port}",
-            f"--node-manager-port={self.node_manager_port}",
-            f"--num-cpus={self.num_cpus}",
-            f"--num-gpus={self.num_gpus}",
+            *self._common_args,
             f"--temp-dir={temp_dir}",
-            "--block"
         ]
 
         print(f"Ray head command: {' '.join(cmd)}")
 
         try:
-            # Start Ray head node in background
-            # We don't use --block here, instead we check status separately
-            cmd_no_block = [c for c in cmd if c != "--block"]
+            # Start Ray head node in background (no --block); readiness is
+            # checked separately through the GCS port
             result = subprocess.run(
-                cmd_no_block,
+                cmd,
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -116,8 +199,12 @@ class RayClusterManager:
             self.head_address = f"{local_ip}:6379"
             print(f"Ray head node started at {self.head_address}")
 
-            # Wait a bit for head node to fully initialize
-            time.sleep(5)
+            # Return as soon as the GCS accepts connections instead of a blind sleep
+            if not self._wait_for_gcs(self.head_address):
+                raise RuntimeError(
+                    f"Ray head GCS not reachable at {self.head_address} "
+                    f"after {self.ready_timeout}s"
+                )
 
             return self.head_address
 
@@ -126,13 +213,101 @@ class RayClusterManager:
         except Exception as e:
             raise RuntimeError(f"Failed to start Ray head node: {e}")
 
-    def start_worker_node(self, head_address: str, temp_dir: str = "/tmp/ray") -> bool:
+    def _remote_worker_command(self, head_address: str, temp_dir: str,
+                               host: str) -> List[str]:
+        """
+        Build the `srun` command that runs a blocking Ray worker on `host`.
+
+        Mirrors the sbatch launch: one task on the node with its GPUs and
+        CPUs, inside the service container when one is configured.
+
+        Args:
+            head_address: Address of Ray head node
+            temp_dir: Directory for Ray temporary files
+            host: Node to run the worker on
+
+        Returns:
+            Command as an argument list
+        """
+        cmd = ["srun", "--nodes=1", "--ntasks=1", f"--nodelist={host}",
+               f"--cpus-per-task={self.num_cpus}"]
+        if self.num_gpus:
+            cmd.append(f"--gpus={self.num_gpus}")
+        if self.log_dir:
+            cmd.append(f"--output={self.log_dir}/ray_worker_{host}.log")
+        if self.container_image:
+            cmd += ["apptainer", "exec", *self.container_args, self.container_image]
+        # --block keeps `ray start` in the foreground so the worker lives as
+        # long as the srun step does
+        cmd += [
+            "ray", "start",
+            f"--address={head_address}",
+            *self._common_args,
+            f"--temp-dir={temp_dir}",
+            "--disable-usage-stats",
+            "--block",
+        ]
+        return cmd
+
+    def _launch_remote_worker(self, head_address: str, temp_dir: str,
+                              host: str) -> subprocess.Popen:
+        """
+        Start a Ray worker on `host` as a background srun step.
+
+        Args:
+            head_address: Address of Ray head node
+            temp_dir: Directory for Ray temporary files
+            host: Node to run the worker on
+
+        Returns:
+            Handle of the srun process
+        """
+        cmd = self._remote_worker_command(head_address, temp_dir, host)
+        print(f"Ray worker command: {' '.join(cmd)}")
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
+        self._worker_procs[host] = proc
+        return proc
+
+    def _wait_for_nodes(self, head_address: str, expected: int,
+                        procs: Dict[str, subprocess.Popen]) -> Tuple[int, int]:
+        """
+        Wait until `ray status` reports at least `expected` active nodes.
+
+        Each srun step in `procs` that has exited lowers the target by one,
+        since its worker can no longer join.
+
+        Args:
+            head_address: Address of Ray head node
+            expected: Node count to wait for if every step in `procs` runs
+            procs: Launched worker steps by host
+
+        Returns:
+            Tuple of (last observed node count, final target)
+        """
+        deadline = time.monotonic() + self.join_timeout
+        while True:
+            target = expected - sum(1 for p in procs.values() if p.poll() is not None)
+            nodes = self._node_count(head_address)
+            if nodes >= target or time.monotonic() >= deadline:
+                return nodes, target
+            time.sleep(1.0)
+
+    def _node_count(self, head_address: str) -> int:
+        """Return the number of active nodes currently in the cluster."""
+        return self._query_cluster_status(head_address).get("nodes", 0)
+
+    def start_worker_node(self, head_address: str, temp_dir: str = "/tmp/ray",
+                          host: Optional[str] = None) -> bool:
         """
         Start Ray worker node and connect to head.
 
         Args:
             head_address: Address of Ray head node (e.g., "192.168.1.100:6379")
             temp_dir: Directory for Ray temporary files
+            host: Node to start the worker on through a backgrounded
+                  `srun --nodelist` step (see start_workers); the local node
+                  when omitted
 
         Returns:
             True if worker started successfully
@@ -140,24 +315,28 @@ class RayClusterManager:
         Raises:
             RuntimeError: If worker fails to connect
         """
-        print(f"Starting Ray worker node, connecting to {head_address}...")
+        if host:
+            joined = self.start_workers(head_address, [host], temp_dir)
+            if not joined[host]:
+                raise RuntimeError(f"Ray worker on {host} did not join {head_address}")
+            return True
 
-        local_ip = self.get_local_ip()
+        self._last_status = None
+        print(f"Starting Ray worker node, connecting to {head_address}...")
 
+        # Ray daemons outlive `ray start` on the local node, so no --block here
         cmd = [
             "ray", "start",
             f"--address={head_address}",
-            f"--node-ip-address={local_ip}",
-            f"--object-manager-port={self.object_manager_port}",
-            f"--node-manager-port={self.node_manager_port}",
-            f"--num-cpus={self.num_cpus}",
-            f"--num-gpus={self.num_gpus}",
+            f"--node-ip-address={self.get_local_ip()}",
+            *self._common_args,
             f"--temp-dir={temp_dir}",
         ]
 
         print(f"Ray worker command: {' '.join(cmd)}")
 
         try:
+            nodes_before = self._node_count(head_address)
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -168,12 +347,17 @@ class RayClusterManager:
             if result.returncode != 0:
                 raise RuntimeError(f"Ray worker failed to start: {result.stderr}")
 
-            print(f"Ray worker node connected to {head_address}")
             print(result.stdout)
 
-            # Wait for worker to fully connect
-            time.sleep(5)
+            # `ray start` has returned; make sure the worker shows up in the cluster
+            nodes, target = self._wait_for_nodes(head_address, nodes_before + 1, {})
+            if nodes < target:
+                raise RuntimeError(
+                    f"Ray worker did not join {head_address} "
+                    f"after {self.join_timeout}s"
+                )
 
+            print(f"Ray worker node connected to {head_address}")
             return True
 
         except subprocess.TimeoutExpired:
@@ -181,20 +365,98 @@ class RayClusterManager:
         except Exception as e:
             raise RuntimeError(f"Failed to start Ray worker: {e}")
 
+    def start_workers(self, head_address: str, hosts: List[str],
+                      temp_dir: str = "/tmp/ray") -> Dict[str, bool]:
+        """
+        Start Ray workers on several nodes concurrently.
+
+        Each worker runs as a backgrounded `srun ... ray start --block` step
+        (inside container_image when set), all launched at once; the call then
+        waits until `ray status` counts one new node per launched worker.
+
+        Args:
+            head_address: Address of Ray head node (e.g., "192.168.1.100:6379")
+            hosts: Node names to start a worker on
+            temp_dir: Directory for Ray temporary files
+
+        Returns:
+            Dict mapping each host to True if its worker is running and the
+            cluster reached the expected node count
+        """
+        if not hosts:
+            return {}
+
+        self._last_status = None
+        print(f"Starting Ray workers on {', '.join(hosts)}, "
+              f"connecting to {head_address}...")
+
+        nodes_before = self._node_count(head_address)
+        procs = {}
+        for host in hosts:
+            try:
+                procs[host] = self._launch_remote_worker(head_address, temp_dir, host)
+            except OSError as e:
+                print(f"Ray worker on {host} failed to launch: {e}")
+
+        expected = nodes_before + len(procs)
+        nodes, target = self._wait_for_nodes(head_address, expected, procs)
+        self._last_status = None
+
+        results = {}
+        for host in hosts:
+            proc = procs.get(host)
+            if proc is None:
+                results[host] = False
+            elif proc.poll() is not None:
+                print(f"Ray worker on {host} exited with code {proc.returncode}")
+                results[host] = False
+            else:
+                results[host] = nodes >= target
+
+        if nodes < target:
+            print(f"Ray cluster has {nodes} nodes, expected {target} "
+                  f"after {self.join_timeout}s")
+        return results
+
     def check_cluster_status(self) -> Dict[str, Any]:
         """
         Check Ray cluster status.
 
         Returns:
             Dict with cluster information:
-                - nodes: Number of nodes
-                - cpus: Total CPUs
-                - gpus: Total GPUs
+                - nodes: Number of active nodes
+                - pending: Number of pending nodes
+                - cpus / cpus_used: Total and used CPUs
+                - gpus / gpus_used: Total and used GPUs
                 - status: "healthy" or "unhealthy"
+                - output: Raw `ray status` output
+            Results younger than status_ttl seconds are returned from cache.
         """
+        if self._last_status is not None:
+            checked_at, status_info = self._last_status
+            if time.monotonic() - checked_at < self.status_ttl:
+                return status_info
+
+        status_info = self._query_cluster_status()
+        self._last_status = (time.monotonic(), status_info)
+        return status_info
+
+    def _query_cluster_status(self, address: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run `ray status` and summarize its result.
+
+        Args:
+            address: Ray head address to query; the local cluster when omitted
+
+        Returns:
+            Dict as described in check_cluster_status
+        """
+        cmd = ["ray", "status"]
+        if address:
+            cmd.append(f"--address={address}")
         try:
             result = subprocess.run(
-                ["ray", "status"],
+                cmd,
                 capture_output=True,
                 text=True,
                 timeout=10
@@ -207,9 +469,9 @@ class RayClusterManager:
             output = result.stdout
             print(f"Ray cluster status:\n{output}")
 
-            # Extract basic info (simplified parsing)
             status_info = {
                 "status": "healthy",
+                **_parse_ray_status(output),
                 "output": output
             }
 
@@ -226,6 +488,13 @@ class RayClusterManager:
             True if stopped successfully
         """
         print("Stopping Ray node...")
+        self._last_status = None
+
+        # Ending the srun steps stops the blocking remote workers
+        for host, proc in self._worker_procs.items():
+            if proc.poll() is None:
+                proc.terminate()
+        self._worker_procs.clear()
 
         try:
             result = subprocess.run(
@@ -326,21 +595,21 @@ class RayClusterManager:
         Returns:
             Command string to start distributed vLLM
         """
-        cmd = (
-            f"python3 -m vllm.entrypoints.openai.api_server "
-            f"--host {host} "
-            f"--port {port} "
-            f"--model {model} "
-            f"--tensor-parallel-size {tensor_parallel_size} "
-            f"--pipeline-parallel-size {pipeline_parallel_size} "
-            f"--gpu-memory-utilization {gpu_memory_utilization} "
-            f"--distributed-executor-backend ray "
-        )
+        parts = [
+            "python3 -m vllm.entrypoints.openai.api_server",
+            f"--host {host}",
+            f"--port {port}",
+            f"--model {model}",
+            f"--tensor-parallel-size {tensor_parallel_size}",
+            f"--pipeline-parallel-size {pipeline_parallel_size}",
+            f"--gpu-memory-utilization {gpu_memory_utilization}",
+            "--distributed-executor-backend ray",
+        ]
 
         if max_model_len:
-            cmd += f"--max-model-len {max_model_len} "
+            parts.append(f"--max-model-len {max_model_len}")
 
         if enforce_eager:
-            cmd += "--enforce-eager "
+            parts.append("--enforce-eager")
 
-        return cmd.strip()
+        return " ".join(parts)
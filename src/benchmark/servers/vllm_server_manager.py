@@ -8,11 +8,22 @@ Handles vLLM server lifecycle:
 """
 
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+import itertools
+import logging
+import re
 import time
 import threading
 from benchmark.servers.base_server_manager import BaseServerManager
 from benchmark.utility import requests
 
+# Per-probe lines go through logging at DEBUG; state changes are printed
+logger = logging.getLogger(__name__)
+
+# `"id": "<model>"` members of a /v1/models reply, matched on the raw bytes
+_MODEL_ID_RE = re.compile(rb'"id"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
 
 class VllmServerManager(BaseServerManager):
     """
@@ -39,14 +50,28 @@ class VllmServerManager(BaseServerManager):
                         - tensor_parallel_size: GPUs for tensor parallelism
                         - pipeline_parallel_size: Stages for pipeline parallelism
                         - ray: Ray cluster configuration
+                    - probe_pool_size: Give readiness probes their own
+                      keep-alive session with this many idle connections
+                      per host (optional; default: the shared session)
+                    - max_backoff: Longest wait in seconds between probes of
+                      an endpoint that keeps refusing connections (default: 30)
         """
         super().__init__(config)
         self.model = config.get("model")
         if not self.model:
             raise ValueError("vLLM configuration must include 'model' parameter")
+        # Ids vLLM may report for the model: the full path or its last
+        # component, in either case
+        short_name = self.model.rsplit("/", 1)[-1]
+        self._model_candidates = {self.model, self.model.lower(), short_name, short_name.lower()}
+        # Worker pool reused by every prepare_service call; created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         # Extract distributed configuration
         service_config = config.get("service_config", {})
+        self._probe_pool_size = service_config.get("probe_pool_size")
+        self._probe_session: Optional[requests.Session] = None
+        self.max_backoff = service_config.get("max_backoff", 30)
         self.distributed_config = service_config.get("distributed", {})
         self.is_distributed = self.distributed_config.get("enabled", False)
 
@@ -58,6 +83,38 @@ class VllmServerManager(BaseServerManager):
         else:
             print("Single-node vLLM mode")
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool used to verify endpoints concurrently."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=32,
+                                                thread_name_prefix="vllm-manager")
+            atexit.register(self.close)
+        return self._executor
+
+    def _get_probe_session(self) -> requests.Session:
+        """
+        Return the session used for /health and /v1/models probes.
+
+        With probe_pool_size set the probes keep their own connections to each
+        server for the whole run, so they never wait on connections checked
+        out by workload traffic in the shared session.
+        """
+        if not self._probe_pool_size:
+            return self.session
+        if self._probe_session is None:
+            self._probe_session = requests.Session(pool_maxsize=self._probe_pool_size,
+                                                   connect_timeout=2)
+        return self._probe_session
+
+    def close(self):
+        """Release the worker pool and probe connections held by the manager."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._probe_session is not None:
+            self._probe_session.close()
+            self._probe_session = None
+
     def verify_health(self, endpoints: List[str], timeout: int = 600) -> bool:
         """
         Verify vLLM server health by checking /health endpoint.
@@ -75,17 +132,32 @@ class VllmServerManager(BaseServerManager):
         """
         if self.is_distributed:
             print(f'Distributed vLLM mode: checking health of head node endpoint only...')
-            # In distributed mode, only the head node has the API server
-            endpoints_to_check = [endpoints[0]] if endpoints else []
         else:
             print(f'Checking health of {len(endpoints)} vLLM endpoints with timeout {timeout}s each...')
-            endpoints_to_check = endpoints
 
-        self.prepare_service(endpoints_to_check, timeout=timeout)
+        if not self.prepare_service(endpoints, timeout=timeout):
+            print("Some vLLM endpoints are not healthy.")
+            return False
 
         print("All vLLM endpoints are healthy.")
         return True
 
+    def ensure_ready(self, endpoints: List[str], timeout: int = 600) -> bool:
+        """
+        Wait until all vLLM endpoints are ready.
+
+        vLLM loads the model at startup, so the health check already covers
+        preparation and a second pass over the endpoints is not needed.
+
+        Args:
+            endpoints: List of vLLM server URLs
+            timeout: Maximum time in seconds to wait for each endpoint
+
+        Returns:
+            True if all endpoints are ready, False otherwise
+        """
+        return self.verify_health(endpoints, timeout)
+
     def _check_single_endpoint_health(self, endpoint: str) -> bool:
         """
         Check health of a single vLLM endpoint.
@@ -97,119 +169,193 @@ class VllmServerManager(BaseServerManager):
             True if healthy, False otherwise
         """
         try:
-            print(f"Checking vLLM health at {endpoint}...", flush=True)
-            res = requests.get(f"{endpoint}/health", timeout=5)
+            logger.debug("Checking vLLM health at %s...", endpoint)
+            res = self.session.get(f"{endpoint}/health", timeout=5)
             status = res.status_code
-            print(f"Health check response from {endpoint}: HTTP {status}")
+            logger.debug("Health check response from %s: HTTP %d", endpoint, status)
 
             if 200 <= status < 300:
                 print(f"vLLM healthy at {endpoint}")
                 return True
             else:
-                print(f"vLLM unhealthy at {endpoint} (HTTP {status})")
+                logger.debug("vLLM unhealthy at %s (HTTP %d)", endpoint, status)
                 return False
 
         except Exception as e:
-            print(f"vLLM unreachable at {endpoint}: {e}")
+            logger.debug("vLLM unreachable at %s: %s", endpoint, e)
             return False
 
-    def prepare_service(self, endpoints: List[str], timeout: int = 600) -> bool:
+    def prepare_service(self, endpoints: List[str], timeout: int = 600,
+                        verify_model: bool = False) -> bool:
         """
         Prepare vLLM service by verifying the model is loaded on all endpoints.
 
-        vLLM typically loads the model at startup, so this method verifies
-        that the model is available by querying the /v1/models endpoint.
+        vLLM loads the model at startup and reports ready on /health once it
+        is loaded, so this method waits for /health on every endpoint. In
+        distributed mode only the first (head) endpoint serves the API.
 
         Args:
             endpoints: List of vLLM server URLs
             timeout: Maximum time in seconds for model verification
+            verify_model: Also check once that /v1/models lists the model
 
         Returns:
             True if model is loaded successfully on all endpoints, False otherwise
         """
-        threads = []
-        results = [False] * len(endpoints)
-
-        for idx, endpoint in enumerate(endpoints):
-            print(f"\nVerifying model '{self.model}' at {endpoint}...")
-            t = threading.Thread(
-                target=self._verify_model_on_endpoint,
-                args=(endpoint, results, idx, timeout)
-            )
-            t.start()
-            threads.append(t)
-
-        # Wait for all verifications to complete
-        for t in threads:
-            t.join()
-
-        return all(results)
-
-    def _verify_model_on_endpoint(self, endpoint: str, results: List[bool],
-                                  idx: int, timeout: int):
+        if self.is_distributed:
+            # In distributed mode, only the head node has the API server
+            endpoints = endpoints[:1]
+        if not endpoints:
+            return True
+        if len(endpoints) == 1:
+            return self._verify_model_on_endpoint(endpoints[0], timeout, threading.Event(),
+                                                  verify_model)
+
+        # All endpoints are polled concurrently over the shared keep-alive
+        # session; the first one that times out aborts the others
+        abort = threading.Event()
+        pool = self._get_executor()
+        futures = [pool.submit(self._verify_model_on_endpoint, endpoint, timeout, abort,
+                               verify_model)
+                   for endpoint in endpoints]
+        for future in as_completed(futures):
+            if not future.result():
+                abort.set()
+                for f in futures:
+                    f.cancel()
+                return False
+
+        return True
+
+    def _verify_model_on_endpoint(self, endpoint: str, timeout: int,
+                                  abort: threading.Event,
+                                  verify_model: bool = False) -> bool:
         """
         Verify model is loaded on a single endpoint.
 
-        vLLM loads models at startup based on the --model parameter.
-        This method verifies the model is accessible via the /v1/models endpoint.
+        vLLM loads models at startup based on the --model parameter and only
+        reports healthy on /health once it has done so, so the poll loop uses
+        the cheap /health probe. The /v1/models listing is read once, after
+        the endpoint is healthy, and only if verify_model is set.
 
         Args:
             endpoint: vLLM server URL
-            results: Shared list to store success/failure
-            idx: Index in results list
             timeout: Request timeout
+            abort: Set when another endpoint failed and polling should stop
+            verify_model: Also check that /v1/models lists the configured model
+
+        Returns:
+            True if the endpoint is ready (and lists the model when checked),
+            False on timeout, abort or a missing model
         """
+        print(f"\nVerifying model '{self.model}' at {endpoint}...")
         try:
             start_time = time.time()
-
-            # Poll the /v1/models endpoint until the model is available or timeout
+            # Probe quickly at first so a server that is nearly up is seen
+            # within a second; slow down to 2s while it keeps loading
+            intervals = itertools.chain([0.2, 0.4, 0.8, 1.6], itertools.repeat(2.0))
+            failures = 0
+            # Connection errors of the same kind in a row; from the third one
+            # on the endpoint is treated as down and the wait doubles each time
+            conn_errors, last_error, backoff = 0, None, 0.2
+            session = self._get_probe_session()
+
+            # Poll the /health endpoint until the server is ready or timeout
             while time.time() - start_time < timeout:
                 try:
-                    res = requests.get(
-                        f"{endpoint}/v1/models",
-                        timeout=10
+                    res = session.get(
+                        f"{endpoint}/health",
+                        # /health has an empty body; allow the longer timeout
+                        # only once the server has been slow repeatedly
+                        timeout=2 if failures < 3 else 10
                     )
                     status = res.status_code
 
                     if 200 <= status < 300:
-                        # Parse response to check if our model is listed
-                        try:
-                            data = res.json()
-                            models = data.get("data", [])
-                            model_ids = [m.get("id") for m in models]
-
-                            print(f"Available models at {endpoint}: {model_ids}")
-
-                            # Check if our model is in the list
-                            # vLLM may use the full model path or just the model name
-                            model_found = any(
-                                self.model in model_id or model_id in self.model
-                                for model_id in model_ids
-                            )
-
-                            if model_found:
-                                print(f"Model '{self.model}' is loaded at {endpoint}")
-                                results[idx] = True
-                                return
-                            else:
-                                print(f"Model '{self.model}' not yet available at {endpoint}, retrying...")
-                        except Exception as e:
-                            print(f"Error parsing models response: {e}")
-                    else:
-                        print(f"Failed to query models at {endpoint} (HTTP {status}), retrying...")
+                        if not verify_model:
+                            print(f"Model '{self.model}' is loaded at {endpoint}")
+                            return True
+                        return self._model_listed(endpoint)
+                    logger.debug("vLLM not ready at %s (HTTP %d), retrying...", endpoint, status)
+                    # The server answers, so it is loading rather than down
+                    conn_errors, last_error, backoff = 0, None, 0.2
 
                 except Exception as e:
-                    print(f"Error querying models at {endpoint}: {e}, retrying...")
-
-                time.sleep(5)  # Wait before retrying
+                    logger.debug("Error querying health at %s: %s, retrying...", endpoint, e)
+                    conn_errors = conn_errors + 1 if type(e) is last_error else 1
+                    last_error = type(e)
+
+                failures += 1
+                delay = next(intervals)
+                if conn_errors >= 3:
+                    backoff = min(backoff * 2, self.max_backoff)
+                    delay = max(delay, backoff)
+                remaining = timeout - (time.time() - start_time)
+                if abort.wait(max(0.0, min(delay, remaining))):  # Wait before retrying
+                    return False
 
             # Timeout reached
-            print(f"Timeout: Model '{self.model}' not available at {endpoint} after {timeout}s")
-            results[idx] = False
+            print(f"Timeout: Model '{self.model}' not available at {endpoint} after "
+                  f"{time.time() - start_time:.1f}s ({failures} failed probes"
+                  + (f", last error: {last_error.__name__}" if last_error else "") + ")")
+            return False
 
         except Exception as e:
             print(f"Error verifying model '{self.model}' at {endpoint}: {e}")
-            results[idx] = False
+            return False
+
+    def _model_listed(self, endpoint: str) -> bool:
+        """
+        Check once that a ready endpoint lists the configured model.
+
+        Args:
+            endpoint: vLLM server URL
+
+        Returns:
+            True if /v1/models lists the model, False otherwise
+        """
+        try:
+            res = self._get_probe_session().get(f"{endpoint}/v1/models", timeout=10)
+            if not 200 <= res.status_code < 300:
+                print(f"Failed to query models at {endpoint} (HTTP {res.status_code})")
+                return False
+
+            # Scan the raw body for an exact id first and stop at the first
+            # hit; the reply can list hundreds of adapters that would
+            # otherwise all be parsed into dicts
+            for match in _MODEL_ID_RE.finditer(res.content):
+                model_id = match.group(1).decode(errors="replace")
+                if model_id in self._model_candidates or model_id.lower() in self._model_candidates:
+                    print(f"Model '{self.model}' is loaded at {endpoint}")
+                    return True
+
+            models = res.json().get("data", ())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available models at %s: %s", endpoint,
+                             [m.get("id") for m in models])
+
+            # Check if our model is in the list
+            # vLLM may use the full model path or just the model name
+            model_found = any(self._matches_model(m.get("id") or "") for m in models)
+
+            if model_found:
+                print(f"Model '{self.model}' is loaded at {endpoint}")
+            else:
+                print(f"Model '{self.model}' is not served at {endpoint}; "
+                      f"available: {[m.get('id') for m in models]}")
+            return model_found
+
+        except Exception as e:
+            print(f"Error querying models at {endpoint}: {e}")
+            return False
+
+    def _matches_model(self, model_id: str) -> bool:
+        """Return True if a reported model id names the configured model."""
+        if not model_id:
+            return False
+        lowered = model_id.lower()
+        return (model_id in self._model_candidates or lowered in self._model_candidates
+                or any(self.model in i or i in self.model for i in (model_id, lowered)))
 
     def get_health_check_endpoint(self) -> str:
         """
@@ -6,12 +6,17 @@ server managers and workload controllers based on the service type
 specified in the recipe configuration.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
 from pathlib import Path 
-from benchmark.servers.base_server_manager import BaseServerManager
-from benchmark.workload.controller import BaseWorkloadController
-from benchmark.workload.executor import BaseWorkloadExecutor
-from benchmark.logging.base_log_collector import BaseLogCollector
+from types import MappingProxyType
+import importlib
+from benchmark.utility import requests
+
+if TYPE_CHECKING:
+    from benchmark.servers.base_server_manager import BaseServerManager
+    from benchmark.workload.controller import BaseWorkloadController
+    from benchmark.workload.executor import BaseWorkloadExecutor
+    from benchmark.logging.base_log_collector import BaseLogCollector
 
 
 class ServiceFactory:
@@ -24,33 +29,108 @@ class ServiceFactory:
     - Workload executors (client-side workload execution)
     """
 
-    # Registry of available services
-    _server_managers: Dict[str, type] = {}
-    _workload_controllers: Dict[str, type] = {}
-    _workload_executors: Dict[str, type] = {}
-    _log_collectors: Dict[str, type] = {}
+    # Registry of available services. Entries are classes or "module:Class"
+    # references that are imported on first use, so a run only loads the
+    # implementations (and their dependencies, e.g. Flask) it actually needs
+    _server_managers: Dict[str, Union[type, str]] = {}
+    _workload_controllers: Dict[str, Union[type, str]] = {}
+    _workload_executors: Dict[str, Union[type, str]] = {}
+    _log_collectors: Dict[str, Union[type, str]] = {}
+    # Classes imported for "module:Class" references, keyed by the reference
+    _resolved: Dict[str, type] = {}
+    _frozen = False
+
+    # Keep-alive HTTP session shared by all managers and controllers
+    _session: Optional[requests.Session] = None
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Get the HTTP session shared by server managers and workload controllers.
+
+        Returns:
+            The shared Session, created on first use
+        """
+        if cls._session is None:
+            cls._session = requests.Session()
+        return cls._session
+
+    @classmethod
+    def close_session(cls):
+        """Close pooled connections held by the shared HTTP session."""
+        if cls._session is not None:
+            cls._session.close()
+            cls._session = None
+
+    @classmethod
+    def _resolve(cls, registry: Dict[str, Union[type, str]], name: str) -> type:
+        """
+        Look up a registered class, importing it if registered by reference.
+
+        Args:
+            registry: One of the registry dicts
+            name: Registered service or collector name
+
+        Returns:
+            The registered class
+        """
+        entry = registry[name]
+        if not isinstance(entry, str):
+            return entry
+        resolved = cls._resolved.get(entry)
+        if resolved is None:
+            module_name, _, class_name = entry.partition(":")
+            resolved = getattr(importlib.import_module(module_name), class_name)
+            cls._resolved[entry] = resolved
+        return resolved
+
+    @classmethod
+    def freeze(cls):
+        """
+        Make the registries read-only once all services are registered.
+
+        Later register_* calls raise RuntimeError instead of silently changing
+        which implementation a running benchmark uses.
+        """
+        cls._server_managers = MappingProxyType(dict(cls._server_managers))
+        cls._workload_controllers = MappingProxyType(dict(cls._workload_controllers))
+        cls._workload_executors = MappingProxyType(dict(cls._workload_executors))
+        cls._log_collectors = MappingProxyType(dict(cls._log_collectors))
+        cls._frozen = True
+
+    @classmethod
+    def _check_not_frozen(cls, name: str):
+        if cls._frozen:
+            raise RuntimeError(f"Cannot register '{name}': ServiceFactory registries are frozen")
 
     @classmethod
     def register_service(cls, service_name: str,
-                        server_manager_class: type,
-                        workload_controller_class: type,
-                        workload_executor_class: type):
+                        server_manager_class: Union[type, str],
+                        workload_controller_class: Union[type, str],
+                        workload_executor_class: Union[type, str]):
         """
         Register a new service implementation.
 
+        Each class may also be given as a "module:Class" string, which is
+        imported the first time the service is created.
+
         Args:
             service_name: Name of the service (e.g., "ollama", "postgres")
             server_manager_class: Class extending BaseServerManager
             workload_controller_class: Class extending BaseWorkloadController
             workload_executor_class: Class extending BaseWorkloadExecutor
+
+        Raises:
+            RuntimeError: If the registries were frozen with freeze()
         """
+        cls._check_not_frozen(service_name)
         cls._server_managers[service_name] = server_manager_class
         cls._workload_controllers[service_name] = workload_controller_class
         cls._workload_executors[service_name] = workload_executor_class
         print(f"Registered service: {service_name}")
 
     @classmethod
-    def create_server_manager(cls, service_name: str, config: Dict[str, Any]) -> BaseServerManager:
+    def create_server_manager(cls, service_name: str, config: Dict[str, Any]) -> "BaseServerManager":
         """
         Create a server manager for the specified service.
 
@@ -70,8 +150,10 @@ class ServiceFactory:
                 f"Available services: {list(cls._server_managers.keys())}"
             )
 
-        manager_class = cls._server_managers[service_name]
-        return manager_class(config)
+        manager_class = cls._resolve(cls._server_managers, service_name)
+        manager = manager_class(config)
+        manager.session = cls.get_session()
+        return manager
 
 
     @classmethod
@@ -79,7 +161,7 @@ class ServiceFactory:
                                    client_nodes: List[str],
                                    port: int = 5000,
                                    timeout: int = 30,
-                                   health_timeout: int = 120) -> BaseWorkloadController:
+                                   health_timeout: int = 120) -> "BaseWorkloadController":
         """
         Create a workload controller for the specified service.
 
@@ -102,11 +184,13 @@ class ServiceFactory:
                 f"Available services: {list(cls._workload_controllers.keys())}"
             )
 
-        controller_class = cls._workload_controllers[service_name]
-        return controller_class(client_nodes, port, timeout, health_timeout)
+        controller_class = cls._resolve(cls._workload_controllers, service_name)
+        controller = controller_class(client_nodes, port, timeout, health_timeout)
+        controller.session = cls.get_session()
+        return controller
 
     @classmethod
-    def create_workload_executor(cls, service_name: str, port: int = 5000) -> BaseWorkloadExecutor:
+    def create_workload_executor(cls, service_name: str, port: int = 5000) -> "BaseWorkloadExecutor":
         """
         Create a workload executor for the specified service.
 
@@ -126,19 +210,20 @@ class ServiceFactory:
                 f"Available services: {list(cls._workload_executors.keys())}"
             )
 
-        executor_class = cls._workload_executors[service_name]
+        executor_class = cls._resolve(cls._workload_executors, service_name)
         return executor_class(port)
     
     @classmethod
-    def register_log_collector(cls, collector_type: str, collector_class: type):
-        """Register a new log collector implementation."""
+    def register_log_collector(cls, collector_type: str, collector_class: Union[type, str]):
+        """Register a new log collector implementation (class or "module:Class")."""
+        cls._check_not_frozen(collector_type)
         cls._log_collectors[collector_type] = collector_class
         print(f"Registered log collector: {collector_type}")
     
     @classmethod
     def create_log_collector(cls, collector_type: str, 
                             config: Dict[str, Any], 
-                            output_dir) -> BaseLogCollector:
+                            output_dir) -> "BaseLogCollector":
         """Create a log collector of the specified type."""
         if collector_type not in cls._log_collectors:
             raise ValueError(
@@ -146,7 +231,7 @@ class ServiceFactory:
                 f"Available types: {list(cls._log_collectors.keys())}"
             )
         
-        collector_class = cls._log_collectors[collector_type]
+        collector_class = cls._resolve(cls._log_collectors, collector_type)
         return collector_class(config, Path(output_dir))
     
     @classmethod
@@ -1,50 +1,44 @@
 """
 Central registry for all service implementations.
-Import and register each service here.
+Register each service here.
+
+Implementations are registered as "module:Class" references and imported by
+ServiceFactory the first time they are used, so the orchestrator does not load
+executor code (Flask, datasets) and a client does not load server managers.
 """
 
 from benchmark.service_factory import ServiceFactory
 
-# Import service implementations
-from benchmark.servers.ollama_server_manager import OllamaServerManager
-from benchmark.workload.controller import OllamaWorkloadController
-from benchmark.workload.executor import OllamaWorkloadExecutor
-
-#import log collector
-from benchmark.logging.tailer_log_collector import TailerLogCollector
-
 # Register Ollama service
 ServiceFactory.register_service(
     "ollama",
-    OllamaServerManager,
-    OllamaWorkloadController,
-    OllamaWorkloadExecutor
+    "benchmark.servers.ollama_server_manager:OllamaServerManager",
+    "benchmark.workload.controller.ollama_workload_controller:OllamaWorkloadController",
+    "benchmark.workload.executor.ollama_workload_executor:OllamaWorkloadExecutor"
 )
 
 
 # Register vLLM service
-from benchmark.servers.vllm_server_manager import VllmServerManager
-from benchmark.workload.controller import VllmWorkloadController
-from benchmark.workload.executor import VllmWorkloadExecutor
-
 ServiceFactory.register_service(
     "vllm",
-    VllmServerManager,
-    VllmWorkloadController,
-    VllmWorkloadExecutor
+    "benchmark.servers.vllm_server_manager:VllmServerManager",
+    "benchmark.workload.controller.vllm_workload_controller:VllmWorkloadController",
+    "benchmark.workload.executor.vllm_workload_executor:VllmWorkloadExecutor"
 )
 
 
 # Register Dummy service (template/example)
-from benchmark.servers.dummy_server_manager import DummyServerManager
-from benchmark.workload.controller import DummyWorkloadController
-from benchmark.workload.executor import DummyWorkloadExecutor
 ServiceFactory.register_service(
     "dummy",
-    DummyServerManager,
-    DummyWorkloadController,
-    DummyWorkloadExecutor
+    "benchmark.servers.dummy_server_manager:DummyServerManager",
+    "benchmark.workload.controller.dummy_workload_controller:DummyWorkloadController",
+    "benchmark.workload.executor.dummy_workload_executor:DummyWorkloadExecutor"
 )
 
 # Register tailer log collector
-ServiceFactory.register_log_collector("tailer", TailerLogCollector)
\ No newline at end of file
+ServiceFactory.register_log_collector(
+    "tailer", "benchmark.logging.tailer_log_collector:TailerLogCollector"
+)
+
+# All services are registered; lock the registries
+ServiceFactory.freeze()
@@ -0,0 +1,51 @@
+"""
+Prompt datasets shared by the workload executors.
+"""
+
+from functools import lru_cache
+from typing import List
+
+
+def ensure_datasets_installed():
+    """
+    Install the 'datasets' package if it is missing.
+
+    Only called at executor boot when explicitly requested
+    (--install-datasets), never from a request handler.
+    """
+    import importlib.util
+    import subprocess
+    import sys
+
+    print("Checking if 'datasets' package is installed...", flush=True)
+    if importlib.util.find_spec("datasets") is None:
+        print("Installing 'datasets' package...", flush=True)
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "datasets"])
+    else:
+        print("'datasets' package is already installed.", flush=True)
+
+
+@lru_cache(maxsize=1)
+def load_hellaswag_prompts() -> List[str]:
+    """
+    Load the hellaswag prompt column once per process.
+
+    Returns:
+        List of prompt strings (the "ctx_a" field of each validation row)
+
+    Raises:
+        RuntimeError: If the 'datasets' package is not installed
+    """
+    try:
+        from datasets import load_dataset
+    except ImportError as e:
+        raise RuntimeError(
+            "The 'datasets' package is required to load the benchmark prompts; "
+            "install it or start the executor with --install-datasets"
+        ) from e
+
+    print("Loading hellaswag dataset...", flush=True)
+    ds = load_dataset("hellaswag", split="validation")
+    prompts = ds["ctx_a"]
+    print(f"Dataset loaded with {len(prompts)} prompts", flush=True)
+    return prompts
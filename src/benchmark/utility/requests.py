@@ -1,48 +1,166 @@
 import http.client
 import urllib.parse
 import json as js
+import threading
+from functools import cached_property, lru_cache
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # orjson not installed: stdlib json, encoded to match
+    json_loads = js.loads
+
+    def json_dumps(obj):
+        return js.dumps(obj).encode()
 
 class Response:
-    def __init__(self, status, data):
+    def __init__(self, status, content, headers=None, raw=None, release=None):
         self.status_code = status
-        self.text = data
+        self.content = content
+        self.headers = headers or {}
         self.ok = 200 <= status < 300
+        # Streamed responses keep the unread body in `raw` until iterated or closed
+        self.raw = raw
+        self._release = release
+
+    @cached_property
+    def text(self):
+        # Decoded on first access only; JSON callers can parse `content` directly
+        return self.content.decode()
 
     def json(self):
-        return js.loads(self.text)
+        return json_loads(self.content)
 
-def get(url, timeout=5):
+    def iter_lines(self, decode_unicode=False):
+        """Yield non-empty body lines of a streamed response, then release it."""
+        try:
+            for line in self.raw:
+                line = line.rstrip(b"\r\n")
+                if line:
+                    yield line.decode() if decode_unicode else line
+        finally:
+            self.close()
+
+    def close(self):
+        if self._release is not None:
+            release, self._release = self._release, None
+            release(self.raw)
+
+@lru_cache(maxsize=256)
+def _parse(url):
+    # Pollers hit the same few URLs over and over; parse each one once
     parsed = urllib.parse.urlparse(url)
-    conn_class = http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
-    conn = conn_class(parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80), timeout=timeout)
+    key = (parsed.scheme, parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80))
     path = parsed.path or "/"
-    print(path, flush=True)
     if parsed.query:
         path += "?" + parsed.query
-    try:
-        conn.request("GET", path)
-        resp = conn.getresponse()
-        data = resp.read().decode()
-        return Response(resp.status, data)
-    finally:
-        conn.close()
+    return key, path
+
+def get(url, timeout=5):
+    return _default_session.get(url, timeout=timeout)
 
 def post(url, json=None, timeout=5):
-    parsed = urllib.parse.urlparse(url)
-    conn_class = http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
-    conn = conn_class(parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80), timeout=timeout)
-    path = parsed.path or "/"
-    if parsed.query:
-        path += "?" + parsed.query
-    body = None
-    headers = {}
-    if json is not None:
-        body = js.dumps(json)
-        headers["Content-Type"] = "application/json"
-    try:
-        conn.request("POST", path, body=body, headers=headers)
-        resp = conn.getresponse()
-        data = resp.read().decode()
-        return Response(resp.status, data)
-    finally:
-        conn.close()
\ No newline at end of file
+    return _default_session.post(url, json=json, timeout=timeout)
+
+def close_all():
+    """Close the keep-alive connections held for module-level get/post."""
+    _default_session.close()
+
+class Session:
+    """Keep-alive HTTP client that reuses one connection per host across calls."""
+
+    def __init__(self, pool_maxsize=32, connect_timeout=2):
+        # pool_maxsize bounds the idle connections kept per host; extra ones
+        # (from bursts of concurrent requests) are closed when released
+        self.pool_maxsize = pool_maxsize
+        # A host that is down fails within connect_timeout even when the
+        # request itself may wait much longer for its reply (e.g. /wait)
+        self.connect_timeout = connect_timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _checkout(self, key, timeout):
+        with self._lock:
+            conns = self._idle.get(key)
+            if conns:
+                conn = conns.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._connect(key, timeout), False
+
+    def _connect(self, key, timeout):
+        scheme, host, port = key
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(host, port, timeout=min(self.connect_timeout, timeout))
+        conn.connect()
+        conn.timeout = timeout
+        conn.sock.settimeout(timeout)
+        return conn
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.pool_maxsize:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def request(self, method, url, json=None, timeout=5, headers=None, data=None, stream=False):
+        key, path = _parse(url)
+        body = data
+        headers = {"Connection": "keep-alive", **(headers or {})}
+        if json is not None:
+            body = json_dumps(json)
+            headers["Content-Type"] = "application/json"
+
+        conn, reused = self._checkout(key, timeout)
+        try:
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError):
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a fresh one
+                conn.close()
+                conn = self._connect(key, timeout)
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+            if stream:
+                return Response(resp.status, None, resp.headers, raw=resp,
+                                release=lambda r: self._release_streamed(key, conn, r))
+            data = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return Response(resp.status, data, resp.headers)
+
+    def _release_streamed(self, key, conn, resp):
+        # Only a fully consumed body leaves the connection reusable
+        if resp.isclosed() and not resp.will_close:
+            self._checkin(key, conn)
+        else:
+            conn.close()
+
+    def get(self, url, timeout=5, headers=None, stream=False):
+        return self.request("GET", url, timeout=timeout, headers=headers, stream=stream)
+
+    def post(self, url, json=None, timeout=5, headers=None, data=None, stream=False):
+        return self.request("POST", url, json=json, timeout=timeout, headers=headers, data=data,
+                            stream=stream)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+# Module-level get/post reuse one connection per host instead of a fresh
+# TCP handshake per call
+_default_session = Session()
@@ -0,0 +1,58 @@
+"""
+On-disk cache of inference responses keyed by (model, prompt).
+
+Lets repeated benchmark runs over the same prompts be served locally
+("warm") instead of hitting the inference server again ("cold"), and
+replays a previous run exactly when used in strict replay mode.
+"""
+
+from hashlib import blake2b
+from typing import Optional
+import sqlite3
+import threading
+
+
+class ResponseCache:
+    """Thread-safe SQLite store of response bodies."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file; shared by every run that should reuse responses
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key BLOB PRIMARY KEY, body BLOB NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(model: str, prompt: str) -> bytes:
+        digest = blake2b(model.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(prompt.encode())
+        return digest.digest()
+
+    def get(self, model: str, prompt: str) -> Optional[bytes]:
+        """Return the cached response body, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE key = ?", (self._key(model, prompt),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, model: str, prompt: str, body: bytes):
+        """Store the response body for a prompt, replacing any earlier one."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body) VALUES (?, ?)",
+                (self._key(model, prompt), body)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,15 +1,17 @@
 """Client modules for various services."""
 
-from benchmark.workload.controller import (
-    BaseWorkloadController,
-    OllamaWorkloadController,
-    DummyWorkloadController,
-)
-from benchmark.workload.executor import (
-    BaseWorkloadExecutor,
-    OllamaWorkloadExecutor,
-    DummyWorkloadExecutor,
-)
+import importlib
+
+# Controllers run on the orchestrator and executors (which need Flask) on the
+# clients; import each side only when one of its names is used
+_EXPORTS = {
+    "BaseWorkloadController": "benchmark.workload.controller",
+    "OllamaWorkloadController": "benchmark.workload.controller",
+    "DummyWorkloadController": "benchmark.workload.controller",
+    "BaseWorkloadExecutor": "benchmark.workload.executor",
+    "OllamaWorkloadExecutor": "benchmark.workload.executor",
+    "DummyWorkloadExecutor": "benchmark.workload.executor",
+}
 
 __all__ = [
     "BaseWorkloadController",
@@ -18,4 +20,13 @@ __all__ = [
     "BaseWorkloadExecutor",
     "OllamaWorkloadExecutor",
     "DummyWorkloadExecutor",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
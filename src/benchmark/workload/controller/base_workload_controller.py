@@ -7,10 +7,17 @@ with WorkloadExecutor instances running on client nodes.
 """
 
 from abc import ABC
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+import gzip
+import logging
+import threading
 import time
 from benchmark.utility import requests
-import json
+from benchmark.utility.requests import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
 
 
 class BaseWorkloadController(ABC): # Will be renamed to BaseWorkloadController (workload context)
@@ -39,43 +46,135 @@ class BaseWorkloadController(ABC): # Will be renamed to BaseWorkloadController (
         """
         self.client_nodes = client_nodes
         self.port = port
+        # Derived from the class name once instead of on every call
+        self._service_name = self.__class__.__name__.replace("WorkloadController", "").lower()
         self.timeout = timeout
         self.health_timeout = health_timeout
+        # Keep-alive connections to the client executors, reused across calls;
+        # ServiceFactory replaces it with the session shared by all components
+        self.session = requests.Session()
+        # Worker pool for per-node requests, created on first use and reused
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Set to abandon verify_client_health (e.g. when the run is aborted),
+        # so its non-daemon worker threads do not hold up interpreter exit
+        self.cancel_event = threading.Event()
+        # Seconds a fetched /metrics response is reused without asking again
+        self.metrics_ttl = 1.0
+        # node -> (fetch time, metrics, ETag) of the last /metrics response
+        self._metrics_cache: Dict[str, Tuple[float, Dict[str, Any], Optional[str]]] = {}
+        # node -> sequence number of the next /metrics/snapshots entry to fetch
+        self._snapshot_seq: Dict[str, int] = {}
+        # node -> in-flight /metrics fetch; callers arriving while it runs
+        # share its result instead of sending their own request
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool used to fan out per-node requests."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(32, max(1, len(self.client_nodes))),
+                thread_name_prefix="workload-controller"
+            )
+        return self._executor
+
+    def _wait_for_client(self, node: str) -> bool:
+        """
+        Wait for a single client node's executor to report healthy.
+
+        Once the executor accepts connections, /health?wait= long-polls until
+        it is ready. Until then, failed connections are retried with
+        exponential backoff (25 ms doubling up to 2 s) instead of a fixed
+        2 s sleep, so a node that comes up is noticed almost immediately.
+
+        Args:
+            node: Client node hostname/IP
+
+        Returns:
+            True if the node became healthy within health_timeout, False if
+            it did not or cancel_event was set
+        """
+        url = f"http://{node}:{self.port}/health"
+        print(f"Waiting for client node {node} to be healthy at {url}...")
+        deadline = time.time() + self.health_timeout
+        backoff = 0.025
+
+        while not self.cancel_event.is_set():
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            # Short enough long-polls that a cancel is noticed promptly
+            wait = min(5.0, remaining)
+            try:
+                resp = self.session.get(f"{url}?wait={wait:.3f}", timeout=wait + 5)
+                if resp.status_code == 200:
+                    print(f"Client node {node} is healthy: {resp.text}")
+                    return True
+                logger.debug("Client node %s not ready yet: HTTP %s", node, resp.status_code)
+                if resp.status_code == 503 and json_loads(resp.content).get("status") == "starting":
+                    # The executor already held the request for `wait`: ask again
+                    continue
+                # Anything else (an older executor, another service on the
+                # port, a server error) must not turn into a tight loop
+            except Exception as e:
+                logger.debug("Client node %s not healthy yet: %s", node, e)
+            self.cancel_event.wait(min(backoff, max(0.0, deadline - time.time())))
+            backoff = min(backoff * 2, 2.0)
+
+        if self.cancel_event.is_set():
+            print(f"Stopped waiting for client node {node}.")
+        else:
+            print(f"ERROR: Client node {node} did not become healthy in time.")
+        return False
 
     def verify_client_health(self) -> bool:
         """
         Verify that all client workload executor servers are ready.
 
+        Nodes are polled concurrently, so the wait is bounded by the slowest
+        node rather than the sum over all nodes.
+
         Returns:
             True if all clients are healthy, False otherwise
         """
-        for node in self.client_nodes:
-            url = f"http://{node}:{self.port}/health"
-            print(f"Waiting for client node {node} to be healthy at {url}...")
-            start = time.time()
-            healthy = False
-
-            while time.time() - start < self.health_timeout:
-                try:
-                    resp = requests.get(url, timeout=5)
-                    if resp.status_code == 200:
-                        print(f"Client node {node} is healthy: {resp.text}")
-                        healthy = True
-                        break
-                except Exception as e:
-                    print(f"Client node {node} not healthy yet: {e}")
-                time.sleep(2)
-
-            if not healthy:
-                print(f"ERROR: Client node {node} did not become healthy in time.")
-                return False
+        if not self.client_nodes:
+            return True
+
+        return all(list(self._get_executor().map(self._wait_for_client, self.client_nodes)))
+
+    def _start_on_node(self, node: str, body: bytes, headers: Dict[str, str]) -> bool:
+        """
+        Trigger workload execution on a single client node.
+
+        Args:
+            node: Client node hostname/IP
+            body: JSON-encoded workload configuration
+            headers: Request headers for the JSON body
+
+        Returns:
+            True if the node accepted the workload, False otherwise
+        """
+        url = f"http://{node}:{self.port}/start"
+        try:
+            print(f"Starting workload on client node {node}: {url}")
+            resp = self.session.post(url, data=body, headers=headers, timeout=self.timeout)
+            data = resp.json()
 
-        return True
+            if resp.status_code == 200 and data.get("success"):
+                print(f"Workload started successfully on {node}.")
+                return True
+            print(f"Failed to start workload on {node}: {resp.text}")
+        except Exception as e:
+            print(f"Error starting workload on {node}: {e}")
+        return False
 
     def start_workload(self, workload_config: Dict[str, Any]) -> bool:
         """
         Trigger workload execution on all client nodes.
 
+        The /start requests are sent concurrently, so all nodes begin within
+        about one round trip of each other.
+
         Args:
             workload_config: Configuration for workload execution
                             (server endpoints, model, duration, etc.)
@@ -83,81 +182,260 @@ class BaseWorkloadController(ABC): # Will be renamed to BaseWorkloadController (
         Returns:
             True if workload started successfully on all clients, False otherwise
         """
-        all_success = True
+        if not self.client_nodes:
+            return True
 
-        for node in self.client_nodes:
-            url = f"http://{node}:{self.port}/start"
-            try:
-                print(f"Starting workload on client node {node}: {url}")
-                resp = requests.post(url, json=workload_config, timeout=self.timeout)
-                data = json.loads(resp.text)
+        # Metrics cached from a previous run must not leak into this one
+        self._metrics_cache.clear()
+        self._snapshot_seq.clear()
+        # Every node receives the same payload, so encode it only once
+        body = json_dumps(workload_config)
+        headers = {"Content-Type": "application/json"}
 
-                if resp.status_code == 200 and data.get("success"):
-                    print(f"Workload started successfully on {node}.")
-                else:
-                    print(f"Failed to start workload on {node}: {resp.text}")
-                    all_success = False
-            except Exception as e:
-                print(f"Error starting workload on {node}: {e}")
-                all_success = False
+        results = self._get_executor().map(
+            lambda node: self._start_on_node(node, body, headers), self.client_nodes
+        )
+        return all(list(results))
 
-        return all_success
+    def _fetch_node_metrics(self, node: str) -> Dict[str, Any]:
+        """
+        Fetch benchmark metrics from a single client node.
+
+        Calls for a node made while a fetch of it is in flight share that
+        fetch's result instead of sending another request.
+
+        Args:
+            node: Client node hostname/IP
 
-    def fetch_metrics(self) -> Dict[str, Any]:
+        Returns:
+            Metrics reported by the node, or {"error": ...} on failure
         """
-        Fetch benchmark metrics from all client nodes.
+        cached = self._metrics_cache.get(node)
+        if cached is not None and time.monotonic() - cached[0] < self.metrics_ttl:
+            return cached[1]
+
+        with self._inflight_lock:
+            inflight = self._inflight.get(node)
+            leader = inflight is None
+            if leader:
+                inflight = self._inflight[node] = Future()
+        if not leader:
+            return inflight.result()
+
+        try:
+            data = self._get_node_metrics(node, cached)
+            inflight.set_result(data)
+            return data
+        except BaseException as e:
+            inflight.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[node]
+
+    def _get_node_metrics(self, node: str,
+                          cached: Optional[Tuple[float, Dict[str, Any], Optional[str]]]) -> Dict[str, Any]:
+        """GET /metrics from a node, revalidating the cached copy by ETag."""
+        url = f"http://{node}:{self.port}/metrics"
+        try:
+            logger.debug("Fetching metrics from client node %s: %s", node, url)
+            headers = {"If-None-Match": cached[2]} if cached is not None and cached[2] else None
+            resp = self.session.get(url, timeout=self.timeout, headers=headers)
+
+            if resp.status_code == 304 and cached is not None:
+                logger.debug("Metrics unchanged on %s.", node)
+                self._metrics_cache[node] = (time.monotonic(), cached[1], cached[2])
+                return cached[1]
+
+            data = json_loads(resp.content)
+
+            if resp.status_code == 200:
+                logger.debug("Metrics fetched from %s.", node)
+                self._metrics_cache[node] = (time.monotonic(), data, resp.headers.get("ETag"))
+                return data
+            print(f"Failed to fetch metrics from {node}: {resp.text}")
+            return {"error": resp.text}
+        except Exception as e:
+            print(f"Error fetching metrics from {node}: {e}")
+            return {"error": str(e)}
+
+    def _wait_on_node(self, node: str, timeout: float) -> Optional[bool]:
+        """
+        Long-poll a client node's /wait endpoint.
+
+        Args:
+            node: Client node hostname/IP
+            timeout: Seconds the executor may hold the request open
+
+        Returns:
+            True if the workload finished, False if it is still running,
+            None if the node could not answer (e.g. no /wait endpoint)
+        """
+        url = f"http://{node}:{self.port}/wait?timeout={timeout}"
+        try:
+            resp = self.session.get(url, timeout=timeout + self.timeout)
+            if resp.status_code == 200:
+                return True
+            if resp.status_code == 204:
+                return False
+            print(f"Unexpected /wait response from {node}: HTTP {resp.status_code}")
+        except Exception as e:
+            print(f"Error waiting on {node}: {e}")
+        return None
+
+    def wait_until_done(self, nodes: Optional[List[str]] = None,
+                        timeout_per_call: float = 30) -> Dict[str, Optional[bool]]:
+        """
+        Block until client workloads finish, using long-polls instead of sleeps.
+
+        All nodes are waited on concurrently and the call returns once every
+        long-poll has answered, i.e. after at most timeout_per_call seconds.
+
+        Args:
+            nodes: Subset of client nodes to wait on (default: all client nodes)
+            timeout_per_call: Seconds each executor may hold its /wait request
+
+        Returns:
+            Dictionary mapping node names to True (finished), False (still
+            running) or None (unknown; fall back to fetch_metrics)
+        """
+        targets = self.client_nodes if nodes is None else nodes
+        pool = self._get_executor()
+        results = pool.map(lambda node: self._wait_on_node(node, timeout_per_call), targets)
+        return dict(zip(targets, results))
+
+    def fetch_metrics(self, nodes: Optional[List[str]] = None,
+                      deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Fetch benchmark metrics from client nodes concurrently.
+
+        Args:
+            nodes: Subset of client nodes to query (default: all client nodes)
+            deadline: Seconds to wait for all nodes to answer (default: no limit
+                      beyond the per-request timeout). Nodes that have not
+                      answered in time are reported as {"running": True} so
+                      they are retried on the next poll.
 
         Returns:
             Dictionary mapping node names to their metrics,
             or empty dict if fetching failed
         """
-        all_metrics = {}
+        targets = self.client_nodes if nodes is None else nodes
+        if not targets:
+            return {}
 
-        for node in self.client_nodes:
-            url = f"http://{node}:{self.port}/metrics"
-            try:
-                print(f"Fetching metrics from client node {node}: {url}")
-                resp = requests.get(url, timeout=self.timeout)
-                data = json.loads(resp.text)
+        pool = self._get_executor()
+        futures = {pool.submit(self._fetch_node_metrics, node): node for node in targets}
+        results = {}
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            for node in targets:
+                if node not in results:
+                    print(f"Timed out fetching metrics from {node}; will retry.")
+                    results[node] = {"running": True, "error": "timeout"}
 
-                if resp.status_code == 200:
-                    all_metrics[node] = data
-                    print(f"Metrics fetched from {node}.")
+        return {node: results[node] for node in targets}
+
+    def _stop_on_node(self, node: str) -> bool:
+        """
+        Stop workload execution on a single client node.
+
+        Args:
+            node: Client node hostname/IP
+
+        Returns:
+            True if the node stopped its workload, False otherwise
+        """
+        url = f"http://{node}:{self.port}/stop"
+        try:
+            print(f"Stopping workload on client node {node}: {url}")
+            resp = self.session.post(url, timeout=self.timeout)
+            data = resp.json()
+
+            if resp.status_code == 200 and data.get("success"):
+                print(f"Workload stopped successfully on {node}.")
+                return True
+            print(f"Failed to stop workload on {node}: {resp.text}")
+        except Exception as e:
+            print(f"Error stopping workload on {node}: {e}")
+        return False
+
+    def _fetch_node_snapshots(self, node: str) -> List[Dict[str, Any]]:
+        """
+        Fetch the metrics snapshots a node has taken since the last call.
+
+        Args:
+            node: Client node hostname/IP
+
+        Returns:
+            New snapshots in the order they were taken (empty on error)
+        """
+        since = self._snapshot_seq.get(node, 0)
+        url = f"http://{node}:{self.port}/metrics/snapshots?since={since}"
+        try:
+            resp = self.session.get(url, timeout=self.timeout, stream=True,
+                                    headers={"Accept-Encoding": "gzip"})
+            try:
+                if resp.status_code != 200:
+                    print(f"Failed to fetch snapshots from {node}: HTTP {resp.status_code}")
+                    return []
+                if resp.headers.get("Content-Encoding") == "gzip":
+                    lines = (line for line in gzip.GzipFile(fileobj=resp.raw) if line.strip())
                 else:
-                    print(f"Failed to fetch metrics from {node}: {resp.text}")
-                    all_metrics[node] = {"error": resp.text}
-            except Exception as e:
-                print(f"Error fetching metrics from {node}: {e}")
-                all_metrics[node] = {"error": str(e)}
+                    lines = resp.iter_lines()
+                snapshots = [json_loads(line) for line in lines]
+            finally:
+                resp.close()
+            self._snapshot_seq[node] = int(resp.headers.get("X-Next-Seq", since + len(snapshots)))
+            return snapshots
+        except Exception as e:
+            print(f"Error fetching snapshots from {node}: {e}")
+            return []
+
+    def fetch_snapshots(self, nodes: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch new real-time metrics snapshots from client nodes concurrently.
+
+        Each call only transfers the snapshots taken since the previous call
+        for that node (tracked per node, reset by start_workload), so polling
+        cost stays constant as a long run accumulates snapshots.
+
+        Args:
+            nodes: Subset of client nodes to query (default: all client nodes)
 
-        return all_metrics
+        Returns:
+            Dictionary mapping node names to their new snapshots
+        """
+        targets = self.client_nodes if nodes is None else nodes
+        if not targets:
+            return {}
+        results = self._get_executor().map(self._fetch_node_snapshots, targets)
+        return dict(zip(targets, results))
 
     def terminate_workload(self) -> bool:
         """
         Stop workload execution on all client nodes.
 
+        Nodes are stopped concurrently; each executor may take a while to join
+        its worker threads, so the wait is bounded by the slowest node.
+
         Returns:
             True if workload stopped successfully on all clients, False otherwise
         """
-        all_success = True
-
-        for node in self.client_nodes:
-            url = f"http://{node}:{self.port}/stop"
-            try:
-                print(f"Stopping workload on client node {node}: {url}")
-                resp = requests.post(url, timeout=self.timeout)
-                data = json.loads(resp.text)
+        self._metrics_cache.clear()
+        if not self.client_nodes:
+            return True
 
-                if resp.status_code == 200 and data.get("success"):
-                    print(f"Workload stopped successfully on {node}.")
-                else:
-                    print(f"Failed to stop workload on {node}: {resp.text}")
-                    all_success = False
-            except Exception as e:
-                print(f"Error stopping workload on {node}: {e}")
-                all_success = False
+        return all(list(self._get_executor().map(self._stop_on_node, self.client_nodes)))
 
-        return all_success
+    def close(self):
+        """Release the worker pool and pooled connections held by the controller."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session.close()
 
     def get_service_name(self) -> str:
         """
@@ -166,4 +444,4 @@ class BaseWorkloadController(ABC): # Will be renamed to BaseWorkloadController (
         Returns:
             Service name (e.g., "ollama", "postgres")
         """
-        return self.__class__.__name__.replace("WorkloadController", "").lower()
+        return self._service_name
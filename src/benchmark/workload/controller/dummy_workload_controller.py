@@ -2,7 +2,7 @@
 Dummy workload controller for template/example service.
 """
 from benchmark.workload.controller import BaseWorkloadController
-from typing import List
+from typing import List, Optional
 
 class DummyWorkloadController(BaseWorkloadController): # Will be renamed to DummyWorkloadController (workload context)
     def __init__(self, client_nodes: List[str], port: int = 5000, timeout: int = 30, health_timeout: int = 120):
@@ -16,8 +16,14 @@ class DummyWorkloadController(BaseWorkloadController): # Will be renamed to Dumm
         print(f"[Dummy] Starting workload with config: {workload_config}")
         return True
     
-    def fetch_metrics(self):
+    def wait_until_done(self, nodes: Optional[List[str]] = None, timeout_per_call: float = 30):
+        """Dummy implementation that reports every client as finished"""
+        targets = self.client_nodes if nodes is None else nodes
+        return {node: True for node in targets}
+
+    def fetch_metrics(self, nodes: Optional[List[str]] = None, deadline: Optional[float] = None):
         """Dummy implementation that simulates immediate completion"""
         print(f"[Dummy] Simulating completed workload")
         # Return metrics showing all clients as completed (running=False)
-        return {node: {"running": False, "status": "completed"} for node in self.client_nodes}
+        targets = self.client_nodes if nodes is None else nodes
+        return {node: {"running": False, "status": "completed"} for node in targets}
@@ -8,9 +8,141 @@ collecting metrics, etc.).
 
 from abc import ABC, abstractmethod
 from flask import Flask, jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.serving import WSGIRequestHandler
 from typing import Dict, Any, Optional, List
+import importlib.util
+import multiprocessing
+import socket
 import threading
 import time
+import zlib
+from benchmark.utility import requests
+from benchmark.utility.response_cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:  # fall back to Flask's stdlib json provider
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # percentiles fall back to sorting a Python list
+    np = None
+
+
+def _percentiles(latencies: List[float], percents: List[float]) -> List[float]:
+    """
+    Nearest-rank percentiles of a list of latencies.
+
+    With NumPy available the ranks are selected with a partial sort (O(n))
+    instead of sorting every latency of every thread.
+
+    Args:
+        latencies: Request latencies in seconds (not modified)
+        percents: Percentiles to compute, e.g. [50, 90, 99]
+
+    Returns:
+        One value per entry of percents; 0.0 for each when latencies is empty
+    """
+    if not latencies:
+        return [0.0] * len(percents)
+    ranks = [int(round((p / 100.0) * (len(latencies) - 1))) for p in percents]
+    if np is not None:
+        selected = np.partition(np.asarray(latencies, dtype=np.float64), ranks)
+        return [float(selected[r]) for r in ranks]
+    ordered = sorted(latencies)
+    return [ordered[r] for r in ranks]
+
+
+# Requested send/receive buffer per executor socket; Linux clamps it to
+# net.core.[rw]mem_max
+_SOCKET_BUFFER_BYTES = 4 * 1024 * 1024
+
+
+def _tune_socket(sock: socket.socket):
+    """
+    Disable Nagle and enlarge the buffers of an executor socket.
+
+    Replies are small JSON bodies written in more than one send; with Nagle
+    on, the later ones wait for the client's delayed ACK (~40 ms).
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_BYTES)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_BYTES)
+    except OSError:  # not a TCP socket (e.g. a Unix socket bind)
+        pass
+
+
+def _gzip_chunks(chunks):
+    """Gzip-compress a stream of byte chunks as they are produced."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class _KeepAliveRequestHandler(WSGIRequestHandler):
+    """Werkzeug handler that speaks HTTP/1.1, so controller connections persist."""
+    # Werkzeug defaults to HTTP/1.0 and closes the socket after every reply,
+    # which defeats the controller's keep-alive session
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        _tune_socket(self.request)
+        super().setup()
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for jsonify and request.get_json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def _serve_with_gunicorn(app: Flask, port: int, threads: int):
+    """
+    Serve the app from one gunicorn gthread worker.
+
+    A single worker keeps all executor state in one process; its threads
+    answer /metrics polls and /start, /stop commands concurrently.
+    """
+    from gunicorn.app.base import BaseApplication
+
+    class _Application(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"0.0.0.0:{port}")
+            self.cfg.set("workers", 1)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", threads)
+            # The controller polls every few seconds; keep its connections open
+            self.cfg.set("keepalive", 75)
+            # Accepted connections inherit the options of the listening sockets
+            self.cfg.set("post_worker_init", _tune_worker_sockets)
+
+        def load(self):
+            return app
+
+    _Application().run()
+
+
+def _tune_worker_sockets(worker):
+    """gunicorn post_worker_init hook: tune the worker's listening sockets."""
+    for listener in worker.sockets:
+        _tune_socket(listener.sock)
+
+
+def _worker_process_main(executor_class, port: int, workload_config: Dict[str, Any],
+                         thread_ids: range, results, stop_receiver):
+    """Entry point of a worker process: run its threads on a fresh executor instance."""
+    executor_class(port)._worker_process(workload_config, thread_ids, results, stop_receiver)
+
 
 class BaseWorkloadExecutor(ABC):
     """
@@ -26,6 +158,15 @@ class BaseWorkloadExecutor(ABC):
     - Collect and report metrics
     """
 
+    # Request-handling threads of the gunicorn worker
+    server_threads = 8
+    # Stack reserved per benchmark worker thread; workers only run a request
+    # loop, so 1 MiB is ample and many clients fit where 8 MiB each would not
+    worker_stack_size = 1024 * 1024
+    # Seconds between the live-metric updates worker processes
+    # (num_executor_procs > 1) send to this process
+    progress_interval = 1.0
+
     def __init__(self, port: int = 5000):
         """
         Initialize the workload executor.
@@ -34,9 +175,23 @@ class BaseWorkloadExecutor(ABC):
             port: Port to run the Flask server on
         """
         self.port = port
+        # Reported on every /health reply; derived from the class name once
+        self._service_name = self.__class__.__name__.replace("WorkloadExecutor", "").lower()
         self.app = Flask(self.__class__.__name__)
+        if orjson is not None:
+            self.app.json = _OrjsonProvider(self.app)
         self.workload_thread: Optional[threading.Thread] = None
         self.workload_running = False
+        # Set whenever no workload is running; /wait blocks on it
+        self.workload_done = threading.Event()
+        self.workload_done.set()
+        # Set by /stop; worker threads check it between requests and wait on
+        # it instead of sleeping, so a stop wakes them immediately
+        self.stop_event = threading.Event()
+        # Set by run() once the executor can accept workloads; subclasses that
+        # finish their setup in the background may clear it until they are done.
+        # /health?wait= blocks on it
+        self.ready_event = threading.Event()
         self.metrics: Dict[str, Any] = {}
         self.workload_error: Optional[str] = None
 
@@ -60,103 +215,156 @@ class BaseWorkloadExecutor(ABC):
         self._register_endpoints()
 
     def _register_endpoints(self):
-        """Register Flask HTTP endpoints."""
+        """
+        Register Flask HTTP endpoints.
 
-        @self.app.route("/health", methods=["GET"])
-        def health():
-            """Health check endpoint."""
-            return jsonify({"status": "ok", "service": self.get_service_name()}), 200
+        The handlers are methods of the executor, so subclasses can override
+        them and Flask dispatches straight to the bound method.
+        """
+        routes = [
+            ("/health", "health", self._health, "GET"),
+            ("/start", "start_workload", self._start_workload, "POST"),
+            ("/metrics", "get_metrics", self._get_metrics, "GET"),
+            ("/wait", "wait_for_completion", self._wait_for_completion, "GET"),
+            ("/metrics/snapshots", "get_snapshots", self._get_snapshots, "GET"),
+            ("/metrics/prometheus", "get_metrics_prometheus", self._get_metrics_prometheus, "GET"),
+            ("/stop", "stop_workload", self._stop_workload, "POST"),
+        ]
+        for rule, endpoint, view_func, method in routes:
+            self.app.add_url_rule(rule, endpoint, view_func, methods=[method])
+
+    def _health(self):
+        """
+        Health check endpoint.
+
+        With `?wait=<seconds>` the request blocks until the executor is ready
+        or the time passes, so callers need not poll; 503 if still not ready.
+        """
+        wait = request.args.get("wait", default=0.0, type=float)
+        if not self.ready_event.wait(max(0.0, wait)):
+            return jsonify({"status": "starting", "service": self.get_service_name()}), 503
+        return jsonify({"status": "ok", "service": self.get_service_name()}), 200
+
+    def _start_workload(self):
+        """Start workload execution."""
+        if self.workload_running:
+            return jsonify({
+                "success": False,
+                "error": "Workload already running"
+            }), 400
 
-        @self.app.route("/start", methods=["POST"])
-        def start_workload():
-            """Start workload execution."""
-            if self.workload_running:
+        try:
+            workload_config = request.get_json()
+            if not workload_config:
                 return jsonify({
                     "success": False,
-                    "error": "Workload already running"
+                    "error": "No workload configuration provided"
                 }), 400
 
-            try:
-                workload_config = request.get_json()
-                if not workload_config:
-                    return jsonify({
-                        "success": False,
-                        "error": "No workload configuration provided"
-                    }), 400
-
-                # Reset state
-                self.metrics = {}
-                self.workload_error = None
-                self.workload_running = True
-                self.thread_metrics = []
-                self.shared_resources = {}
-
-                # Start workload in background thread
-                self.workload_thread = threading.Thread(
-                    target=self._workload_wrapper,
-                    args=(workload_config,)
-                )
-                self.workload_thread.start()
-
-                return jsonify({
-                    "success": True,
-                    "message": "Workload started"
-                }), 200
+            # Reset state
+            self.metrics = {}
+            self.workload_error = None
+            self.workload_running = True
+            self.workload_done.clear()
+            self.stop_event.clear()
+            self.thread_metrics = []
+            self.shared_resources = {}
+
+            # Start workload in background thread
+            self.workload_thread = threading.Thread(
+                target=self._workload_wrapper,
+                args=(workload_config,)
+            )
+            self.workload_thread.start()
 
-            except Exception as e:
-                self.workload_running = False
-                return jsonify({
-                    "success": False,
-                    "error": str(e)
-                }), 500
-
-        @self.app.route("/metrics", methods=["GET"])
-        def get_metrics():
-            """Fetch collected metrics in Prometheus format in JSON format (legacy endpoint)."""
-            # Check Accept header for content negotiation
-            accept = request.headers.get('Accept', '')
-            
-            # If Prometheus is scraping or explicit prometheus format requested
-            if 'text/plain' in accept or request.args.get('format') == 'prometheus':
-                return self._metrics_prometheus_format(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
-            
-            # Default JSON format for orchestrator
             return jsonify({
-                "running": self.workload_running,
-                "metrics": self.metrics,
-                "error": self.workload_error
+                "success": True,
+                "message": "Workload started"
             }), 200
 
-        @self.app.route("/metrics/prometheus", methods=["GET"])
-        def get_metrics_prometheus():
-            """Fetch collected metrics in Prometheus text format."""
+        except Exception as e:
+            self.workload_running = False
+            self.workload_done.set()
+            return jsonify({
+                "success": False,
+                "error": str(e)
+            }), 500
+
+    def _get_metrics(self):
+        """Fetch collected metrics in Prometheus format in JSON format (legacy endpoint)."""
+        # Check Accept header for content negotiation
+        accept = request.headers.get('Accept', '')
+
+        # If Prometheus is scraping or explicit prometheus format requested
+        if 'text/plain' in accept or request.args.get('format') == 'prometheus':
             return self._metrics_prometheus_format(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
 
-        @self.app.route("/stop", methods=["POST"])
-        def stop_workload():
-            """Stop workload execution."""
-            if not self.workload_running:
-                return jsonify({
-                    "success": True,
-                    "message": "No workload running"
-                }), 200
+        # Default JSON format for orchestrator; tagged with an ETag so
+        # unchanged metrics are answered with 304 Not Modified
+        response = jsonify({
+            "running": self.workload_running,
+            "metrics": self.metrics,
+            "error": self.workload_error
+        })
+        response.add_etag()
+        return response.make_conditional(request)
+
+    def _wait_for_completion(self):
+        """Long-poll until the workload finishes or `timeout` seconds pass."""
+        timeout = request.args.get("timeout", default=30.0, type=float)
+        if self.workload_done.wait(timeout):
+            return jsonify({"running": False}), 200
+        return "", 204
+
+    def _get_snapshots(self):
+        """
+        Stream the metrics snapshots taken after sequence number `since`.
 
-            try:
-                self.workload_running = False
-                if self.workload_thread and self.workload_thread.is_alive():
-                    # Wait for thread to finish (with timeout)
-                    self.workload_thread.join(timeout=10)
+        One JSON object per line (NDJSON), gzip-compressed when the client
+        accepts it. X-Next-Seq is the `since` to pass on the next call, so
+        each poll only transfers snapshots the client has not seen yet.
+        """
+        since = max(0, request.args.get("since", default=0, type=int))
+        with self.metrics_lock:
+            new = self.snapshots[since:]
+        dumps = self.app.json.dumps
+        lines = (f"{dumps(snapshot)}\n".encode() for snapshot in new)
+        headers = {"X-Next-Seq": str(since + len(new))}
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            lines = _gzip_chunks(lines)
+        return Response(lines, mimetype="application/x-ndjson", headers=headers)
+
+    def _get_metrics_prometheus(self):
+        """Fetch collected metrics in Prometheus text format."""
+        return self._metrics_prometheus_format(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+
+    def _stop_workload(self):
+        """Stop workload execution."""
+        if not self.workload_running:
+            return jsonify({
+                "success": True,
+                "message": "No workload running"
+            }), 200
 
-                return jsonify({
-                    "success": True,
-                    "message": "Workload stopped"
-                }), 200
+        try:
+            # workload_running is cleared by _workload_wrapper once all
+            # worker threads have returned
+            self.stop_event.set()
+            if self.workload_thread and self.workload_thread.is_alive():
+                # Wait for thread to finish (with timeout)
+                self.workload_thread.join(timeout=10)
 
-            except Exception as e:
-                return jsonify({
-                    "success": False,
-                    "error": str(e)
-                }), 500
+            return jsonify({
+                "success": True,
+                "message": "Workload stopped"
+            }), 200
+
+        except Exception as e:
+            return jsonify({
+                "success": False,
+                "error": str(e)
+            }), 500
 
     def _workload_wrapper(self, workload_config: Dict[str, Any]):
         """
@@ -165,13 +373,15 @@ class BaseWorkloadExecutor(ABC):
         New flow:
         1. Prepare shared benchmark state (hook _prepare_shared_resources)
         2. Start background monitoring thread (real-time metrics)
-        3. Spawn N worker threads that run _run_benchmark
+        3. Spawn N worker threads that run _run_benchmark, spread over
+           num_executor_procs processes (default 1, i.e. only this one)
         4. Join threads and aggregate final metrics
         5. Stop monitoring thread
         """
         try:
             num_threads = int(workload_config.get("num_threads", workload_config.get("clients_per_node", 1)))
-            print(f"Starting benchmark with {num_threads} threads.")
+            num_procs = max(1, min(num_threads, int(workload_config.get("num_executor_procs", 1))))
+            print(f"Starting benchmark with {num_threads} threads in {num_procs} process(es).")
 
             # Initialize shared metric structures
             with self.metrics_lock:
@@ -190,60 +400,208 @@ class BaseWorkloadExecutor(ABC):
                 self.thread_metrics = []
                 self.snapshots = []
 
-            # Prepare shared resources once before spawning threads (can be overridden by subclasses)
-            self._prepare_shared_resources(workload_config)
-
-            # Start background monitoring thread for real-time metrics
-            self.monitoring_active = True
-            self.monitoring_thread = threading.Thread(
-                target=self._metrics_monitoring_loop,
-                daemon=True
-            )
-            self.monitoring_thread.start()
+            # Thread i runs in process i % num_procs; this process is 0.
+            # Worker processes come from a forkserver rather than a fork of
+            # this process, whose server threads may hold locks at fork time
+            procs = []
+            stop_receiver = stop_sender = None
+            try:
+                if num_procs > 1:
+                    ctx = multiprocessing.get_context("forkserver")
+                    # One message per child on stop; a pipe rather than an Event,
+                    # whose set() hangs on waiters in processes that have exited
+                    stop_receiver, stop_sender = ctx.Pipe(duplex=False)
+                    for p in range(1, num_procs):
+                        receiver, sender = ctx.Pipe(duplex=False)
+                        proc = ctx.Process(
+                            target=_worker_process_main,
+                            args=(type(self), self.port, workload_config,
+                                  range(p, num_threads, num_procs), sender, stop_receiver),
+                            name=f"client-proc-{p}", daemon=True
+                        )
+                        proc.start()
+                        # Only the child keeps the sending end, so a crashed child
+                        # shows up as EOF instead of a recv() that never returns
+                        sender.close()
+                        relay = threading.Thread(target=self._relay_worker_process,
+                                                 args=(proc, receiver), daemon=True)
+                        relay.start()
+                        procs.append((proc, relay))
+
+                # Prepare shared resources once before spawning threads (can be overridden by subclasses)
+                self._prepare_shared_resources(workload_config)
+
+                # Keep-alive connections to the servers shared by all threads, with
+                # room for one idle connection per thread and host
+                if "session" not in self.shared_resources:
+                    self.shared_resources["session"] = requests.Session(pool_maxsize=num_threads)
+
+                # Optional response cache shared by all threads (see _cached_response)
+                if workload_config.get("response_cache"):
+                    self.shared_resources["response_cache"] = ResponseCache(workload_config["response_cache"])
+
+                # Start background monitoring thread for real-time metrics
+                self.monitoring_active = True
+                self.monitoring_thread = threading.Thread(
+                    target=self._metrics_monitoring_loop,
+                    daemon=True
+                )
+                self.monitoring_thread.start()
+
+                self._run_threads(workload_config, range(0, num_threads, num_procs))
+            finally:
+                # Whatever ended our threads (duration, /stop or an error)
+                # ends the children's too; their results are always collected
+                if procs:
+                    self._collect_worker_processes(procs, stop_sender)
+                for conn in (stop_sender, stop_receiver):
+                    if conn is not None:
+                        conn.close()
+
+            # Stop monitoring thread; the event also wakes it from its pause
+            self.monitoring_active = False
+            self.stop_event.set()
+            if self.monitoring_thread and self.monitoring_thread.is_alive():
+                self.monitoring_thread.join(timeout=5)
 
-            threads = []
+            # Aggregate metrics from all threads
+            self._aggregate_metrics(workload_config)
 
-            def thread_target(thread_idx: int):
-                try:
-                    print(f"Starting benchmark thread {thread_idx}: model={workload_config.get('model')}, "
-                          f"servers={len(workload_config.get('server_endpoints', []))}, "
-                          f"duration={workload_config.get('duration')}", flush=True)
+        except Exception as e:
+            self.workload_error = str(e)
+            print(f"Workload execution error: {e}")
+            self.monitoring_active = False
+        finally:
+            for name in ("response_cache", "session"):
+                resource = self.shared_resources.get(name)
+                if resource is not None:
+                    resource.close()
+            self.workload_running = False
+            self.workload_done.set()
 
-                    # Each thread collects its own metrics
-                    thread_metrics = self._run_benchmark(workload_config, thread_idx)
+    def _run_threads(self, workload_config: Dict[str, Any], thread_ids: range):
+        """Run _run_benchmark in one thread per id and collect their results."""
+        def thread_target(thread_idx: int):
+            try:
+                print(f"Starting benchmark thread {thread_idx}: model={workload_config.get('model')}, "
+                      f"servers={len(workload_config.get('server_endpoints', []))}, "
+                      f"duration={workload_config.get('duration')}", flush=True)
 
-                    # Store thread metrics in thread-safe manner
-                    if thread_metrics:
-                        with self.metrics_lock:
-                            self.thread_metrics.append(thread_metrics)
+                # Each thread collects its own metrics
+                thread_metrics = self._run_benchmark(workload_config, thread_idx)
 
-                except Exception as e:
-                    print(f"Thread {thread_idx} error: {e}")
+                # Store thread metrics in thread-safe manner
+                if thread_metrics:
                     with self.metrics_lock:
-                        self.thread_metrics.append({"error": str(e), "thread_id": thread_idx})
+                        self.thread_metrics.append(thread_metrics)
+
+            except Exception as e:
+                print(f"Thread {thread_idx} error: {e}")
+                with self.metrics_lock:
+                    self.thread_metrics.append({"error": str(e), "thread_id": thread_idx})
 
-            for i in range(num_threads):
+        threads = []
+        previous_stack_size = threading.stack_size(self.worker_stack_size)
+        try:
+            for i in thread_ids:
                 t = threading.Thread(target=thread_target, args=(i,), name=f"client-thread-{i}")
                 t.start()
                 threads.append(t)
+        finally:
+            threading.stack_size(previous_stack_size)
 
-            for t in threads:
-                t.join()
+        for t in threads:
+            t.join()
 
-            # Stop monitoring thread
-            self.monitoring_active = False
-            if self.monitoring_thread and self.monitoring_thread.is_alive():
-                self.monitoring_thread.join(timeout=5)
+    def _collect_worker_processes(self, procs: List[tuple], stop_sender):
+        """Stop the worker processes and wait until their results are added."""
+        for _ in procs:
+            stop_sender.send(None)
+        for proc, relay in procs:
+            relay.join()
+            proc.join()
 
-            # Aggregate metrics from all threads
-            self._aggregate_metrics(workload_config)
+    def _relay_worker_process(self, proc, receiver):
+        """
+        Merge a worker process's live metrics into per_thread_metrics.
 
-        except Exception as e:
-            self.workload_error = str(e)
-            print(f"Workload execution error: {e}")
-            self.monitoring_active = False
+        Runs in this process for each child until the child sends its final
+        thread results (or exits without them), which are then added to
+        thread_metrics.
+        """
+        try:
+            while True:
+                kind, payload = receiver.recv()
+                if kind == "results":
+                    break
+                with self.metrics_lock:
+                    for thread_id, update in payload.items():
+                        live = self.per_thread_metrics.setdefault(thread_id, {"latencies": []})
+                        live["latencies"].extend(update.pop("latencies"))
+                        live.update(update)
+        except (EOFError, OSError):
+            payload = [{"error": f"{proc.name} exited without results", "thread_id": None}]
         finally:
-            self.workload_running = False
+            receiver.close()
+        with self.metrics_lock:
+            self.thread_metrics.extend(payload)
+
+    def _worker_process(self, workload_config: Dict[str, Any], thread_ids: range,
+                        results, stop_receiver):
+        """
+        Run this process's share of the benchmark threads (num_executor_procs > 1).
+
+        Called on a fresh executor in a process started by the forkserver, so
+        no locks, connections or response cache are inherited from the serving
+        process. Live thread metrics go to the parent every progress_interval
+        seconds through `results`, followed by the final thread results.
+        """
+        # Relay the parent's stop message to this process's worker threads
+        threading.Thread(target=lambda: (stop_receiver.recv(), self.stop_event.set()),
+                         daemon=True).start()
+
+        self._prepare_shared_resources(workload_config)
+        self.shared_resources["session"] = requests.Session(pool_maxsize=len(thread_ids))
+        if workload_config.get("response_cache"):
+            self.shared_resources["response_cache"] = ResponseCache(workload_config["response_cache"])
+
+        progress_done = threading.Event()
+        progress = threading.Thread(target=self._send_progress, args=(results, progress_done),
+                                    daemon=True)
+        progress.start()
+        try:
+            self._run_threads(workload_config, thread_ids)
+        finally:
+            progress_done.set()
+            progress.join()
+            for name in ("response_cache", "session"):
+                resource = self.shared_resources.get(name)
+                if resource is not None:
+                    resource.close()
+            results.send(("results", self.thread_metrics))
+            results.close()
+
+    def _send_progress(self, results, done: threading.Event):
+        """
+        Send this process's live thread metrics to the parent until `done` is set.
+
+        Counters are sent as they stand; of each latencies list only the
+        entries added since the previous update.
+        """
+        sent: Dict[int, int] = {}
+        while True:
+            finished = done.wait(self.progress_interval)
+            update = {}
+            with self.metrics_lock:
+                for thread_id, live in self.per_thread_metrics.items():
+                    start = sent.get(thread_id, 0)
+                    latencies = live["latencies"][start:]
+                    sent[thread_id] = start + len(latencies)
+                    update[thread_id] = {**live, "latencies": latencies}
+            if update:
+                results.send(("progress", update))
+            if finished:
+                return
 
     def _prepare_shared_resources(self, workload_config: Dict[str, Any]):
         """
@@ -255,12 +613,63 @@ class BaseWorkloadExecutor(ABC):
         - Set up any resources that all threads will use
 
         Subclasses should override this to set up shared_resources dict.
+        Afterwards shared_resources["session"] is filled with a keep-alive
+        requests.Session sized to the thread count unless a subclass set one.
 
         Args:
             workload_config: The workload configuration
         """
         pass
 
+    def _cached_response(self, workload_config: Dict[str, Any], model: str,
+                         prompt: str) -> Optional[bytes]:
+        """
+        Look up a prompt in the run's response cache.
+
+        Enabled by workload_config["response_cache"] (path of the SQLite
+        cache file). With workload_config["replay_mode"] set, a miss raises
+        instead of falling through to the server, so a run is replayed only
+        from recorded responses.
+
+        Returns:
+            The cached response body, or None when the request must be sent
+        """
+        cache = self.shared_resources.get("response_cache")
+        if cache is None:
+            return None
+        body = cache.get(model, prompt)
+        if body is None and workload_config.get("replay_mode"):
+            raise LookupError("replay_mode: prompt not in response cache")
+        return body
+
+    def _store_response(self, model: str, prompt: str, body: bytes):
+        """Record a server response in the run's response cache, if enabled."""
+        cache = self.shared_resources.get("response_cache")
+        if cache is not None:
+            cache.put(model, prompt, body)
+
+    def _live_thread_metrics(self, thread_id: int, latencies: List[float]) -> Dict[str, Any]:
+        """
+        Register the live metrics record of a worker thread for monitoring.
+
+        The record shares the thread's own latencies list and the thread
+        updates its counters in place, so recording a request takes neither
+        metrics_lock nor a copy of the latencies; the monitoring thread reads
+        the records under the lock.
+
+        Args:
+            thread_id: ID of the worker thread
+            latencies: The list the thread appends its request latencies to
+
+        Returns:
+            The record; update it with requests, errors, total_latency, elapsed
+        """
+        live = {"requests": 0, "errors": 0, "total_latency": 0.0, "elapsed": 0.0,
+                "latencies": latencies}
+        with self.metrics_lock:
+            self.per_thread_metrics[thread_id] = live
+        return live
+
     @abstractmethod
     def _run_benchmark(self, workload_config: Dict[str, Any], thread_id: int) -> Dict[str, Any]:
         """
@@ -270,7 +679,7 @@ class BaseWorkloadExecutor(ABC):
         1. Parse workload_config
         2. Execute benchmark (send requests, etc.)
         3. Collect thread-local metrics and return them
-        4. Respect self.workload_running flag (check it periodically)
+        4. Stop once self.stop_event is set (check it between requests)
         5. Use self.shared_resources for any pre-loaded data
 
         Args:
@@ -283,8 +692,9 @@ class BaseWorkloadExecutor(ABC):
         Returns:
             Dict containing metrics for this thread
 
-        The implementation should periodically check self.workload_running
-        and stop gracefully if it becomes False.
+        The implementation should check self.stop_event between requests
+        and pace itself with self.stop_event.wait(seconds) rather than
+        time.sleep, so /stop interrupts the pause.
         """
         pass
 
@@ -307,6 +717,8 @@ class BaseWorkloadExecutor(ABC):
         total_errors = 0
         total_latency = 0.0
         total_elapsed = 0.0
+        cache_hits = 0
+        warm_latency = 0.0
         error_threads = []
         all_latencies = []
 
@@ -319,6 +731,8 @@ class BaseWorkloadExecutor(ABC):
             total_errors += thread_metric.get("errors", 0)
             total_latency += thread_metric.get("total_latency", 0.0)
             total_elapsed = max(total_elapsed, thread_metric.get("elapsed_seconds", 0.0))
+            cache_hits += thread_metric.get("cache_hits", 0)
+            warm_latency += thread_metric.get("warm_total_latency", 0.0)
             all_latencies.extend(thread_metric.get("latencies", []))
 
         # Calculate aggregate metrics
@@ -326,18 +740,7 @@ class BaseWorkloadExecutor(ABC):
         throughput = total_requests / total_elapsed if total_elapsed > 0 else 0
 
         # Percentiles (p50/p90/p99) over all recorded request latencies
-        all_latencies.sort()
-
-        def percentile(p: float) -> float:
-            if not all_latencies:
-                return 0.0
-            # nearest-rank style index
-            idx = int(round((p / 100.0) * (len(all_latencies) - 1)))
-            return all_latencies[idx]
-
-        p50 = percentile(50)
-        p90 = percentile(90)
-        p99 = percentile(99)
+        p50, p90, p99 = _percentiles(all_latencies, [50, 90, 99])
 
 
         self.metrics = {
@@ -353,11 +756,16 @@ class BaseWorkloadExecutor(ABC):
             "thread_errors": error_threads if error_threads else None,
             **{k: v for k, v in workload_config.items() if k in ["model", "duration"]}
         }
+        if workload_config.get("response_cache"):
+            # Latency fields above cover cold (server) requests only
+            self.metrics["cache_hits"] = cache_hits
+            self.metrics["avg_warm_latency_seconds"] = warm_latency / cache_hits if cache_hits else 0
 
     def _metrics_monitoring_loop(self):
         """Background thread that snapshots metrics during execution."""
         while self.monitoring_active:
-            time.sleep(5)
+            if self.stop_event.wait(5):
+                break
             self._snapshot_current_metrics()
 
     def _snapshot_current_metrics(self):
@@ -412,7 +820,7 @@ class BaseWorkloadExecutor(ABC):
         Returns:
             Service name (e.g., "ollama", "postgres")
         """
-        return self.__class__.__name__.replace("WorkloadExecutor", "").lower()
+        return self._service_name
 
     def _parse_duration(self, duration: str) -> int:
         """
@@ -494,6 +902,18 @@ class BaseWorkloadExecutor(ABC):
         return '\n'.join(lines) + '\n'
 
     def run(self):
-        """Start the Flask server."""
+        """
+        Start the HTTP server, under gunicorn when it is installed.
+
+        gunicorn's arbiter installs signal handlers, which only the main
+        thread may do; run() called from another thread (as in the tests)
+        uses Werkzeug instead.
+        """
         print(f"Starting {self.get_service_name()} workload executor on port {self.port}...")
-        self.app.run(host="0.0.0.0", port=self.port)
+        self.ready_event.set()
+        if (threading.current_thread() is threading.main_thread()
+                and importlib.util.find_spec("gunicorn") is not None):
+            _serve_with_gunicorn(self.app, self.port, self.server_threads)
+        else:  # gunicorn not installed or not on the main thread: Werkzeug's threaded server
+            self.app.run(host="0.0.0.0", port=self.port, threaded=True,
+                         request_handler=_KeepAliveRequestHandler)
@@ -39,35 +39,22 @@ class DummyWorkloadExecutor(BaseWorkloadExecutor):
         end_time = start_time + duration_seconds
         
         # Initialize per-thread metrics
-        with self.metrics_lock:
-            self.per_thread_metrics[thread_id] = {
-                "requests": 0,
-                "errors": 0,
-                "total_latency": 0.0,
-                "elapsed": 0.0,
-                "latencies": []
-            }
+        live = self._live_thread_metrics(thread_id, latencies)
         
         # Simulate requests
-        while self.workload_running and time.time() < end_time:
+        while not self.stop_event.is_set() and time.time() < end_time:
             try:
                 # Simulate request latency (50-200ms)
                 latency = random.uniform(0.05, 0.2)
-                time.sleep(latency)
+                self.stop_event.wait(latency)
                 
                 request_count += 1
                 total_latency += latency
                 latencies.append(latency)
                 
                 # Update per-thread metrics every request
-                with self.metrics_lock:
-                    self.per_thread_metrics[thread_id] = {
-                        "requests": request_count,
-                        "errors": error_count,
-                        "total_latency": total_latency,
-                        "elapsed": time.time() - start_time,
-                        "latencies": latencies.copy()
-                    }
+                live.update(requests=request_count, errors=error_count,
+                            total_latency=total_latency, elapsed=time.time() - start_time)
                     
             except Exception as e:
                 error_count += 1
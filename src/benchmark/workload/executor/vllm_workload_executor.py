@@ -9,6 +9,7 @@ import argparse
 import random
 import time
 from typing import Dict, Any
+from benchmark.utility.prompts import ensure_datasets_installed, load_hellaswag_prompts
 from benchmark.workload.executor import BaseWorkloadExecutor
 
 
@@ -29,22 +30,18 @@ class VllmWorkloadExecutor(BaseWorkloadExecutor):
         """
         super().__init__(port)
         print(f"Initialized vLLM workload executor on port {port}")
-        # Import here to ensure datasets is installed first
-        self._ensure_datasets_installed()
+        # Load the dataset at startup so /start never pays for it; fails fast
+        # if 'datasets' is missing (see --install-datasets)
+        load_hellaswag_prompts()
 
     def _prepare_shared_resources(self, workload_config: Dict[str, Any]):
         """
-        Load the dataset once before spawning threads.
+        Share the prompt list loaded at startup with all threads.
 
-        This avoids loading the same dataset multiple times (once per thread).
+        The dataset is loaded once per process, so repeated /start calls
+        reuse the same prompts instead of reloading them.
         """
-        print("Loading hellaswag dataset once for all threads...", flush=True)
-        from datasets import load_dataset
-
-        ds = load_dataset("hellaswag", split="validation")
-        self.shared_resources["dataset"] = ds
-        self.shared_resources["num_prompts"] = len(ds)
-        print(f"Dataset loaded with {len(ds)} prompts", flush=True)
+        self.shared_resources["prompts"] = load_hellaswag_prompts()
 
     def _run_benchmark(self, workload_config: Dict[str, Any], thread_id: int) -> Dict[str, Any]:
         """
@@ -61,8 +58,6 @@ class VllmWorkloadExecutor(BaseWorkloadExecutor):
         Returns:
             Dict containing metrics for this thread
         """
-        from benchmark.utility import requests
-
         # Parse configuration
         server_endpoints = workload_config.get("server_endpoints", [])
         model = workload_config.get("model")
@@ -73,22 +68,19 @@ class VllmWorkloadExecutor(BaseWorkloadExecutor):
         if not model:
             raise ValueError("No model specified in workload config")
 
-        # Use shared dataset
-        ds = self.shared_resources.get("dataset")
-        num_prompts = self.shared_resources.get("num_prompts", 0)
+        # Use shared prompts and the keep-alive session shared by all threads
+        prompts = self.shared_resources.get("prompts")
+        session = self.shared_resources["session"]
 
-        if not ds or num_prompts == 0:
+        if not prompts:
             raise ValueError("Dataset not loaded in shared resources")
 
-        # Function to get a random prompt
-        def get_random_prompt():
-            idx = random.randint(0, num_prompts - 1)
-            return ds[idx]["ctx_a"]
-
         # Initialize thread-local metrics
         request_count = 0
         error_count = 0
         total_latency = 0.0
+        cache_hits = 0
+        warm_latency = 0.0
         latencies = []  # Track individual latencies for percentile calculation
         start_time = time.time()
 
@@ -99,55 +91,49 @@ class VllmWorkloadExecutor(BaseWorkloadExecutor):
         print(f"[Thread {thread_id}] Running benchmark for {duration_seconds} seconds...", flush=True)
 
         # Initialize per-thread metrics tracking
-        with self.metrics_lock:
-            self.per_thread_metrics[thread_id] = {
-                "requests": 0,
-                "errors": 0,
-                "total_latency": 0.0,
-                "elapsed": 0.0,
-                "latencies": []
-            }
+        live = self._live_thread_metrics(thread_id, latencies)
 
         # Simple round-robin load generation with random prompts
         # Offset server_idx by thread_id to distribute load
         server_idx = thread_id
-        while self.workload_running and time.time() < end_time:
+        while not self.stop_event.is_set() and time.time() < end_time:
             endpoint = server_endpoints[server_idx % len(server_endpoints)]
             server_idx += 1
 
-            prompt = get_random_prompt()
+            prompt = random.choice(prompts)
 
             try:
                 request_start = time.time()
 
-                # Send inference request to vLLM using OpenAI-compatible API
-                res = requests.post(
-                    f"{endpoint}/v1/completions",
-                    json={
-                        "model": model,
-                        "prompt": prompt,
-                        "max_tokens": 100,
-                        "temperature": 0.7
-                    },
-                    timeout=120
-                )
+                cached = self._cached_response(workload_config, model, prompt)
+                if cached is None:
+                    # Send inference request to vLLM using OpenAI-compatible API
+                    res = session.post(
+                        f"{endpoint}/v1/completions",
+                        json={
+                            "model": model,
+                            "prompt": prompt,
+                            "max_tokens": 100,
+                            "temperature": 0.7
+                        },
+                        timeout=120
+                    )
 
                 request_latency = time.time() - request_start
 
-                if 200 <= res.status_code < 300:
+                if cached is not None:
+                    # Warm hit: answered from the response cache, not the server
+                    cache_hits += 1
+                    warm_latency += request_latency
+                elif 200 <= res.status_code < 300:
+                    self._store_response(model, prompt, res.content)
                     request_count += 1
                     total_latency += request_latency
                     latencies.append(request_latency)
                     
                     # Update per-thread metrics for real-time monitoring
-                    with self.metrics_lock:
-                        self.per_thread_metrics[thread_id] = {
-                            "requests": request_count,
-                            "errors": error_count,
-                            "total_latency": total_latency,
-                            "elapsed": time.time() - start_time,
-                            "latencies": latencies.copy()
-                        }
+                    live.update(requests=request_count, errors=error_count,
+                                total_latency=total_latency, elapsed=time.time() - start_time)
                 else:
                     error_count += 1
                     print(f"[Thread {thread_id}] Request failed: HTTP {res.status_code}")
@@ -157,7 +143,7 @@ class VllmWorkloadExecutor(BaseWorkloadExecutor):
                 print(f"[Thread {thread_id}] Request error: {e}")
 
             # Small delay to avoid overwhelming servers
-            time.sleep(0.1)
+            self.stop_event.wait(0.1)
 
         # Calculate thread-local metrics
         elapsed_time = time.time() - start_time
@@ -173,21 +159,10 @@ class VllmWorkloadExecutor(BaseWorkloadExecutor):
             "elapsed_seconds": elapsed_time,
             "total_latency": total_latency,  # This will be summed for avg calculation
             "latencies": latencies,  # Individual latencies for percentile calculation
+            "cache_hits": cache_hits,
+            "warm_total_latency": warm_latency,
         }
 
-    def _ensure_datasets_installed(self):
-        """Ensure the datasets package is installed."""
-        print("Checking if 'datasets' package is installed...", flush=True)
-        import importlib.util
-        import subprocess
-        import sys
-
-        if importlib.util.find_spec("datasets") is None:
-            print("Installing 'datasets' package...", flush=True)
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "datasets"])
-        else:
-            print("'datasets' package is already installed.", flush=True)
-
     def _parse_duration(self, duration: str) -> int:
         """
         Parse duration string to seconds.
@@ -215,8 +190,13 @@ def main():
     parser = argparse.ArgumentParser(description="vLLM Workload Executor")
     parser.add_argument("--port", type=int, default=5000,
                        help="Port to run the workload executor server on")
+    parser.add_argument("--install-datasets", action="store_true",
+                       help="pip install the 'datasets' package at startup if it is missing")
     args = parser.parse_args()
 
+    if args.install_datasets:
+        ensure_datasets_installed()
+
     executor = VllmWorkloadExecutor(port=args.port)
     executor.run()
 
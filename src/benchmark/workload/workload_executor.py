@@ -5,14 +5,20 @@ Selects and runs the correct service-specific executor using the factory/registr
 import argparse
 from benchmark.service_factory import ServiceFactory
 import benchmark.service_registry
+from benchmark.utility.prompts import ensure_datasets_installed
 
 def main():
     parser = argparse.ArgumentParser(description="General Workload Executor")
     parser.add_argument("--service", type=str, required=True, help="Service type")
     parser.add_argument("--port", type=int, default=6000, help="Port to run workload executor")
     parser.add_argument("--timeout", type=int, default=600, help="Timeout in seconds")
+    parser.add_argument("--install-datasets", action="store_true",
+                        help="pip install the 'datasets' package at startup if it is missing")
     args = parser.parse_args()
 
+    if args.install_datasets:
+        ensure_datasets_installed()
+
     executor = ServiceFactory.create_workload_executor(args.service, port=args.port)
     executor.run()
 
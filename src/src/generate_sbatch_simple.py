@@ -200,6 +200,9 @@ def generate_sbatch(recipe, output_path):
     service_image_path = f"{container_dir}/{service_image['path']}"
     python_image_path = f"{container_dir}/{python_image['path']}"
 
+    # Executors that load the hellaswag prompts need the 'datasets' package
+    executor_flags = " --install-datasets" if service_type in ("ollama", "vllm") else ""
+
     # Check if this is distributed vLLM
     is_distributed_vllm = False
     distributed_config = {}
@@ -392,7 +395,7 @@ echo "Starting workload executor servers on $CLIENT_NODE_LIST..."
     # These run the general workload_executor entry point and select the correct service implementation
     for NODE in $CLIENT_NODE_LIST; do
         srun --nodes=1 --nodelist=$NODE --ntasks=1 --cpus-per-task={cpus_clients} --output=$OUTPUT_DIR/client_${{NODE}}.log \\
-            bash -c "apptainer exec {python_image_path} bash -c 'pip install flask requests && python3 -m benchmark.workload.workload_executor --service {service_type} --port {CLIENT_PORT}'" &
+            bash -c "apptainer exec {python_image_path} bash -c 'pip install flask gunicorn requests && python3 -m benchmark.workload.workload_executor --service {service_type} --port {CLIENT_PORT}{executor_flags}'" &
         pids+=($!)
     done
 